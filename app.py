@@ -1,15 +1,22 @@
 import streamlit as st
-import requests
+import asyncio
+import aiohttp
+import hashlib
 import google.generativeai as genai
 import pandas as pd
-import json
+import orjson
 import os
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from pathlib import Path
 from dotenv import load_dotenv
 import plotly.express as px
 import plotly.graph_objects as go
 from streamlit_option_menu import option_menu
+from google.api_core.exceptions import ResourceExhausted
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential_jitter
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 # Load environment variables
 load_dotenv()
@@ -26,136 +33,31 @@ st.set_page_config(
 )
 
 # Custom CSS for better styling
-st.markdown("""
-<style>
-    /* Global text color fix */
-    .stMarkdown, .stText, .stDataFrame, .stSelectbox, .stMultiselect {
-        color: #333333 !important;
-    }
-    
-    /* Main header */
-    .main-header {
-        font-size: 3rem;
-        font-weight: bold;
-        color: #1f77b4;
-        text-align: center;
-        margin-bottom: 2rem;
-    }
-    
-    /* Category cards */
-    .category-card {
-        background-color: #f8f9fa;
-        padding: 1rem;
-        border-radius: 10px;
-        margin: 0.5rem 0;
-        border-left: 4px solid #1f77b4;
-        color: #333333;
-    }
-    
-    /* Article cards */
-    .article-card {
-        background-color: #ffffff;
-        padding: 1.5rem;
-        border-radius: 10px;
-        margin: 1rem 0;
-        box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-        border: 1px solid #e0e0e0;
-        color: #333333;
-    }
-    
-    /* Summary boxes */
-    .summary-box {
-        background-color: #e8f4fd;
-        padding: 1rem;
-        border-radius: 8px;
-        border-left: 4px solid #1f77b4;
-        margin: 1rem 0;
-        color: #333333;
-    }
-    
-    /* Metric cards */
-    .metric-card {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        padding: 1.5rem;
-        border-radius: 10px;
-        text-align: center;
-    }
-    
-    /* Buttons */
-    .stButton > button {
-        background-color: #1f77b4;
-        color: white;
-        border-radius: 20px;
-        padding: 0.5rem 2rem;
-        border: none;
-        font-weight: 600;
-    }
-    
-    .stButton > button:hover {
-        background-color: #1565c0;
-        transform: translateY(-2px);
-        box-shadow: 0 4px 8px rgba(0,0,0,0.2);
-    }
-    
-    /* Sidebar improvements */
-    .css-1d391kg {
-        background-color: #f8f9fa;
-    }
-    
-    /* Text elements */
-    .stMarkdown p, .stMarkdown div {
-        color: #333333 !important;
-    }
-    
-    /* Select boxes and inputs */
-    .stSelectbox > div > div {
-        color: #333333 !important;
-    }
-    
-    /* Data frames */
-    .stDataFrame {
-        color: #333333 !important;
-    }
-    
-    /* Better contrast for all text */
-    .stMarkdown, .stText, .stDataFrame, .stSelectbox, .stMultiselect, .stTextInput {
-        color: #333333 !important;
-    }
-    
-    /* Article titles */
-    .article-title {
-        color: #1f77b4 !important;
-        font-weight: bold;
-        font-size: 1.2rem;
-    }
-    
-    /* Article descriptions */
-    .article-description {
-        color: #555555 !important;
-        line-height: 1.6;
-    }
-    
-    /* Source and date */
-    .article-meta {
-        color: #666666 !important;
-        font-size: 0.9rem;
-    }
-</style>
-""", unsafe_allow_html=True)
+@st.cache_resource
+def _css():
+    """Read the stylesheet once per process"""
+    return (Path(__file__).parent / 'assets' / 'style.css').read_text()
+
+st.markdown(f"<style>{_css()}</style>", unsafe_allow_html=True)
 
 # Initialize session state
 if 'user_preferences' not in st.session_state:
     st.session_state.user_preferences = {
         'interests': [],
         'frequency': 'daily',
-        'saved_articles': [],
+        'saved_articles': {},  # url -> article
         'ratings': {}
     }
 
 if 'news_data' not in st.session_state:
     st.session_state.news_data = []
 
+if 'summaries' not in st.session_state:
+    st.session_state.summaries = {}
+
+if 'futures' not in st.session_state:
+    st.session_state.futures = {}  # tuple of article urls -> Future of their summaries
+
 # News categories and interests
 NEWS_CATEGORIES = {
     'Technology': ['artificial intelligence', 'cybersecurity', 'software', 'hardware', 'startups'],
@@ -166,69 +68,317 @@ NEWS_CATEGORIES = {
     'Entertainment': ['movies', 'music', 'celebrity', 'gaming', 'streaming']
 }
 
-def fetch_news(interests, frequency='daily'):
-    """Fetch news articles based on user interests"""
+NEWS_API_URL = "https://newsapi.org/v2/everything"
+NEWS_API_MAX_RETRIES = 2
+NEWS_API_RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+def _retry_after_seconds(value):
+    """Parse a Retry-After header given as seconds or an HTTP date; None if unusable"""
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+class TokenBucket:
+    """Async token-bucket rate limiter that only waits once the budget is spent"""
+    
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+        self.lock = asyncio.Lock()
+    
+    async def acquire(self):
+        """Take one token, sleeping just long enough for it to refill if needed"""
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+    
+    def pause(self, seconds):
+        """Hold back all callers for the given number of seconds"""
+        # Refill up to now first, so time spent in flight is not credited against the pause
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+        self.tokens = min(self.tokens, 0) - seconds * self.rate
+    
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+async def fetch_news_async(interests, frequency='daily'):
+    """Fetch news articles for all interests concurrently"""
     news_api_key = os.getenv('NEWS_API_KEY')
     if not news_api_key:
         st.error("News API key not found. Please set NEWS_API_KEY in your environment variables.")
         return []
     
-    all_articles = []
+    # Calculate date range based on frequency
+    if frequency == 'daily':
+        from_date = datetime.now() - timedelta(days=1)
+    else:  # weekly
+        from_date = datetime.now() - timedelta(days=7)
+    
+    # Build every (category, keyword) request up front
+    news_requests = []
+    for category in interests:
+        for keyword in NEWS_CATEGORIES.get(category, [])[:2]:  # Limit keywords per category
+            params = {
+                'q': keyword,
+                'from': from_date.strftime('%Y-%m-%d'),
+                'sortBy': 'publishedAt',
+                'language': 'en',
+                'apiKey': news_api_key,
+                'pageSize': 5
+            }
+            news_requests.append((category, keyword, params))
+    
+    # Limit in-flight requests and request rate to respect NewsAPI rate limits
+    semaphore = asyncio.Semaphore(5)
+    bucket = TokenBucket(rate=5, capacity=5)
+    
+    async def _one(session, category, keyword, params):
+        async with semaphore:
+            for attempt in range(NEWS_API_MAX_RETRIES + 1):
+                async with bucket:
+                    response = await session.get(NEWS_API_URL, params=params)
+                async with response:
+                    if response.headers.get('X-RateLimit-Remaining') == '0':
+                        bucket.pause(1)
+                    if response.status in NEWS_API_RETRY_STATUSES and attempt < NEWS_API_MAX_RETRIES:
+                        delay = _retry_after_seconds(response.headers.get('Retry-After', ''))
+                        if delay is None:
+                            delay = 0.3 * (2 ** attempt)
+                        bucket.pause(delay)
+                        continue
+                    if response.status != 200:
+                        return category, keyword, {}
+                    return category, keyword, orjson.loads(await response.read())
+    
+    # One pooled connector keeps connections to newsapi.org alive across keywords
+    connector = aiohttp.TCPConnector(limit=8, ttl_dns_cache=300)
+    async with aiohttp.ClientSession(
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(total=15),
+        headers={'Accept-Encoding': 'gzip'}
+    ) as session:
+        results = await asyncio.gather(
+            *[_one(session, category, keyword, params) for category, keyword, params in news_requests],
+            return_exceptions=True
+        )
     
-    for category, keywords in NEWS_CATEGORIES.items():
-        if category in interests:
-            for keyword in keywords[:2]:  # Limit keywords per category
-                try:
-                    # Calculate date range based on frequency
-                    if frequency == 'daily':
-                        from_date = datetime.now() - timedelta(days=1)
-                    else:  # weekly
-                        from_date = datetime.now() - timedelta(days=7)
-                    
-                    url = f"https://newsapi.org/v2/everything"
-                    params = {
-                        'q': keyword,
-                        'from': from_date.strftime('%Y-%m-%d'),
-                        'sortBy': 'publishedAt',
-                        'language': 'en',
-                        'apiKey': news_api_key,
-                        'pageSize': 5
-                    }
-                    
-                    response = requests.get(url, params=params)
-                    if response.status_code == 200:
-                        articles = response.json().get('articles', [])
-                        for article in articles:
-                            article['category'] = category
-                            article['keyword'] = keyword
-                        all_articles.extend(articles)
-                    
-                    time.sleep(0.1)  # Rate limiting
-                    
-                except Exception as e:
-                    st.warning(f"Error fetching news for {keyword}: {str(e)}")
+    all_articles = []
+    seen_urls = set()
+    seen_titles = set()  # Catches the same story reposted under another URL
+    for (category, keyword, _), result in zip(news_requests, results):
+        if isinstance(result, Exception):
+            st.warning(f"Error fetching news for {keyword}: {str(result)}")
+            continue
+        
+        _, _, data = result
+        for article in data.get('articles', []):
+            url = article.get('url')
+            title = (article.get('title') or '').lower().strip()
+            # Untitled articles are only deduplicated by URL
+            title_hash = hashlib.blake2b(title.encode(), digest_size=8).digest() if title else None
+            if url in seen_urls or title_hash in seen_titles:
+                continue
+            seen_urls.add(url)
+            if title_hash:
+                seen_titles.add(title_hash)
+            
+            article['category'] = category
+            article['keyword'] = keyword
+            all_articles.append(article)
     
     return all_articles
 
+@st.cache_data(ttl=900, show_spinner="Fetching news...")
+def _fetch_daily_news(interests, day):
+    """Fetch daily news, memoized per interest set and calendar day"""
+    articles = asyncio.run(fetch_news_async(list(interests), 'daily'))
+    if not articles:
+        # Raising keeps an empty or failed fetch out of the cache
+        raise RuntimeError("No articles could be fetched for your interests.")
+    return articles
+
+@st.cache_data(ttl=3600, show_spinner="Fetching news...")
+def _fetch_weekly_news(interests, day):
+    """Fetch weekly news, memoized per interest set and calendar day"""
+    articles = asyncio.run(fetch_news_async(list(interests), 'weekly'))
+    if not articles:
+        # Raising keeps an empty or failed fetch out of the cache
+        raise RuntimeError("No articles could be fetched for your interests.")
+    return articles
+
+def fetch_news(interests, frequency='daily'):
+    """Fetch news articles based on user interests"""
+    cached_fetch = _fetch_daily_news if frequency == 'daily' else _fetch_weekly_news
+    try:
+        # Pick order is part of the key, since the feed follows it
+        return cached_fetch(tuple(interests), date.today().isoformat())
+    except RuntimeError as e:
+        st.warning(str(e))
+        return []
+
+async def prefetch_images(urls):
+    """Download all thumbnails concurrently; failed downloads come back as None"""
+    async def _one(session, url):
+        async with session.get(url) as response:
+            return await response.read() if response.status == 200 else None
+    
+    async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10)) as session:
+        results = await asyncio.gather(*[_one(session, url) for url in urls], return_exceptions=True)
+    return [None if isinstance(result, Exception) else result for result in results]
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def fetch_image_bytes(urls):
+    """Fetch thumbnail bytes for a tuple of image URLs, keyed by URL"""
+    return dict(zip(urls, asyncio.run(prefetch_images(urls))))
+
+# Articles per background Gemini batch request
+SUMMARY_BATCH_SIZE = 5
+
+# Fixed summarization instructions, sent once as the model's system instruction
+SUMMARY_INSTRUCTION = """
+Please provide a concise summary (2-3 sentences) of the news article you are given.
+Focus on the key points and main story. Make it engaging and informative.
+"""
+
+@st.cache_resource
+def get_gemini_model():
+    """Create the general-purpose Gemini model once per process"""
+    return genai.GenerativeModel('gemini-1.5-flash')
+
+@st.cache_resource
+def get_summary_model():
+    """Create the single-article summary model once per process"""
+    return genai.GenerativeModel(
+        'gemini-1.5-flash',
+        system_instruction=SUMMARY_INSTRUCTION,
+        # A 2-3 sentence summary fits comfortably in 120 tokens
+        generation_config=genai.GenerationConfig(max_output_tokens=120, temperature=0.3, top_p=0.9)
+    )
+
+@retry(
+    retry=retry_if_exception_type(ResourceExhausted),
+    wait=wait_exponential_jitter(initial=1, max=10),
+    stop=stop_after_attempt(3),
+    reraise=True
+)
+def generate_content(model, contents, **kwargs):
+    """Call Gemini, backing off with jitter when the quota is exhausted"""
+    return model.generate_content(contents, **kwargs)
+
+def _summary_html(summary):
+    """Render a summary inside the styled summary box"""
+    return f'<div class="summary-box"><strong>AI Summary:</strong><br>{summary}</div>'
+
+@st.cache_data(ttl=24 * 3600, max_entries=1000, show_spinner=False)
+def _cached_summary(content_hash, _article_text, _title):
+    """Stream a summary into the page, memoized by the article content hash"""
+    content = f"""
+    Title: {_title}
+    Content: {_article_text[:1000]}...
+    """
+    
+    # The placeholder lives inside the cached function so cache hits replay the finished box
+    placeholder = st.empty()
+    chunks = []
+    try:
+        for chunk in generate_content(get_summary_model(), content, stream=True):
+            chunks.append(chunk.text)
+            placeholder.markdown(_summary_html(''.join(chunks)), unsafe_allow_html=True)
+    except Exception:
+        # Clear the partial box so only the error is left on the card
+        placeholder.empty()
+        raise
+    return ''.join(chunks)
+
 def summarize_article(article_text, title):
     """Summarize article using Gemini API"""
+    article_text = article_text or ''
+    title = title or ''
+    content_hash = hashlib.sha1((title + article_text[:1000]).encode()).hexdigest()
     try:
-        model = genai.GenerativeModel('gemini-pro')
-        
-        prompt = f"""
-        Please provide a concise summary (2-3 sentences) of this news article:
-        
-        Title: {title}
-        Content: {article_text[:1000]}...
-        
-        Focus on the key points and main story. Make it engaging and informative.
-        """
-        
-        response = model.generate_content(prompt)
-        return response.text
+        return _cached_summary(content_hash, article_text, title)
     except Exception as e:
         return f"Summary unavailable: {str(e)}"
 
+@st.cache_resource
+def _pool():
+    """Shared worker pool for Gemini calls that should not block the script thread"""
+    return ThreadPoolExecutor(max_workers=8)
+
+def summarize_articles_batch(articles, model=None):
+    """Summarize several articles with a single Gemini request"""
+    if not articles:
+        return []
+    model = model or get_gemini_model()
+    
+    payload = [
+        {
+            'idx': idx,
+            'title': article.get('title') or '',
+            'content': (article.get('content') or article.get('description') or '')[:1000]
+        }
+        for idx, article in enumerate(articles)
+    ]
+    
+    prompt = f"""
+    Return a JSON array of 2-sentence summaries, one per input article.
+    Each element must look like {{"idx": <input idx>, "summary": "<summary>"}}.
+    Respond with the JSON array only.
+    
+    Articles: {orjson.dumps(payload).decode()}
+    """
+    
+    try:
+        response = generate_content(model, prompt)
+        # The model sometimes wraps JSON in a markdown code fence
+        text = response.text.strip().removeprefix('```json').removeprefix('```').removesuffix('```')
+        
+        summaries = ["Summary unavailable"] * len(articles)
+        for item in orjson.loads(text):
+            idx = item.get('idx')
+            if isinstance(idx, int) and 0 <= idx < len(articles):
+                summaries[idx] = item.get('summary', summaries[idx])
+        return summaries
+    except Exception as e:
+        return [f"Summary unavailable: {str(e)}"] * len(articles)
+
+@st.cache_data(show_spinner=False)
+def _to_df(news_data):
+    """Build a DataFrame view of the fetched articles"""
+    return pd.DataFrame(news_data, columns=None if news_data else ['category'])
+
+def collect_summaries():
+    """Move finished background summaries into session state"""
+    for urls, future in list(st.session_state.futures.items()):
+        if future.done():
+            for url, summary in zip(urls, future.result()):
+                # Failed batches are left out so those cards can be summarized again
+                if not summary.startswith("Summary unavailable"):
+                    st.session_state.summaries[url] = summary
+            del st.session_state.futures[urls]
+
 def categorize_articles(articles):
     """Categorize articles by user interests"""
     categorized = {}
@@ -241,8 +391,10 @@ def categorize_articles(articles):
 
 def save_article(article):
     """Save article to user's saved list"""
-    if article not in st.session_state.user_preferences['saved_articles']:
-        st.session_state.user_preferences['saved_articles'].append(article)
+    url = article.get('url')
+    saved_articles = st.session_state.user_preferences['saved_articles']
+    if url and url not in saved_articles:
+        saved_articles[url] = article
         st.success("Article saved!")
 
 def rate_article(article_id, rating):
@@ -278,6 +430,9 @@ def main():
             st.session_state.user_preferences['interests'] = selected_interests
             st.session_state.user_preferences['frequency'] = frequency
             st.session_state.news_data = fetch_news(selected_interests, frequency)
+            st.session_state.categorized = categorize_articles(st.session_state.news_data)
+            image_urls = tuple(a['urlToImage'] for a in st.session_state.news_data if a.get('urlToImage'))
+            st.session_state.images = fetch_image_bytes(image_urls)
             st.success("Preferences updated! Fetching latest news...")
         
         # Saved articles count
@@ -295,6 +450,8 @@ def main():
 
 def display_main_dashboard():
     """Display the main news dashboard"""
+    news_df = _to_df(st.session_state.news_data)
+    ratings = pd.Series(st.session_state.user_preferences['ratings'], dtype='float64')
     
     # Dashboard metrics
     col1, col2, col3, col4 = st.columns(4)
@@ -306,15 +463,13 @@ def display_main_dashboard():
     
     with col2:
         st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-        categories_count = len(set(article.get('category', 'Unknown') for article in st.session_state.news_data))
+        categories_count = news_df['category'].fillna('Unknown').nunique()
         st.metric("Categories", categories_count)
         st.markdown('</div>', unsafe_allow_html=True)
     
     with col3:
         st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-        avg_rating = 0
-        if st.session_state.user_preferences['ratings']:
-            avg_rating = sum(st.session_state.user_preferences['ratings'].values()) / len(st.session_state.user_preferences['ratings'])
+        avg_rating = ratings.mean() if not ratings.empty else 0
         st.metric("Avg Rating", f"{avg_rating:.1f}/5")
         st.markdown('</div>', unsafe_allow_html=True)
     
@@ -327,15 +482,35 @@ def display_main_dashboard():
     if st.session_state.news_data:
         st.header("📰 Your Personalized News Feed")
         
-        # Categorize articles
-        categorized_articles = categorize_articles(st.session_state.news_data)
+        # Summarize every article without a summary in parallel background batches
+        if st.button("🤖 Summarize All"):
+            in_flight = {url for urls in st.session_state.futures for url in urls}
+            pending = [
+                a for a in st.session_state.news_data
+                if a.get('url', '') not in st.session_state.summaries and a.get('url', '') not in in_flight
+            ]
+            model = get_gemini_model()
+            for start in range(0, len(pending), SUMMARY_BATCH_SIZE):
+                batch = pending[start:start + SUMMARY_BATCH_SIZE]
+                urls = tuple(a.get('url', '') for a in batch)
+                st.session_state.futures[urls] = _pool().submit(summarize_articles_batch, batch, model)
+        
+        collect_summaries()
+        if st.session_state.futures:
+            remaining = sum(len(urls) for urls in st.session_state.futures)
+            st.status(f"Generating summaries for {remaining} articles...", state="running")
         
-        # Display articles by category
-        for category, articles in categorized_articles.items():
+        # Display articles by category, grouped once at fetch time
+        for category, articles in st.session_state.get('categorized', {}).items():
             st.markdown(f'<div class="category-card"><h3>📂 {category}</h3></div>', unsafe_allow_html=True)
             
             for article in articles:
                 display_article_card(article)
+        
+        # Poll until the background summaries are in
+        if st.session_state.futures:
+            time.sleep(0.5)
+            st.rerun()
     else:
         st.info("👆 Select your interests and update preferences to see your personalized news feed!")
 
@@ -354,31 +529,41 @@ def display_article_card(article):
         st.write(description[:200] + "..." if len(description) > 200 else description)
         
         # Generate and display summary
-        if st.button(f"🤖 Generate Summary", key=f"summary_{article.get('url', '')}"):
+        summary = st.session_state.summaries.get(article.get('url', ''))
+        if summary is not None:
+            st.markdown(_summary_html(summary), unsafe_allow_html=True)
+        elif st.button(f"🤖 Generate Summary", key=f"summary_{article.get('url', '')}"):
             with st.spinner("Generating summary..."):
+                # Streams the summary box into the card as tokens arrive
                 summary = summarize_article(article.get('content', ''), article.get('title', ''))
-                st.markdown(f'<div class="summary-box"><strong>AI Summary:</strong><br>{summary}</div>', unsafe_allow_html=True)
-        
-        # Article actions
-        col_action1, col_action2, col_action3 = st.columns(3)
-        
-        with col_action1:
-            if st.button("💾 Save", key=f"save_{article.get('url', '')}"):
-                save_article(article)
+            # Failures are shown inline only, so the button stays available for a retry
+            if summary.startswith("Summary unavailable"):
+                st.markdown(_summary_html(summary), unsafe_allow_html=True)
+            else:
+                st.session_state.summaries[article.get('url', '')] = summary
         
-        with col_action2:
-            rating = st.selectbox("⭐ Rate", [1, 2, 3, 4, 5], key=f"rate_{article.get('url', '')}")
-            if st.button("Submit Rating", key=f"submit_rate_{article.get('url', '')}"):
-                rate_article(article.get('url', ''), rating)
-                st.success(f"Rated {rating} stars!")
+        # Article actions, batched in a form so each submit is a single rerun
+        with st.form(key=f"form_{article.get('url', '')}", clear_on_submit=False):
+            col_action1, col_action2, col_action3 = st.columns(3)
+            save_clicked = col_action1.form_submit_button("💾 Save")
+            rating = col_action2.selectbox("⭐ Rate", [1, 2, 3, 4, 5], key=f"rate_{article.get('url', '')}")
+            rate_clicked = col_action2.form_submit_button("Submit Rating")
+            share_clicked = col_action3.form_submit_button("📤 Share")
         
-        with col_action3:
-            if st.button("📤 Share", key=f"share_{article.get('url', '')}"):
-                st.write(f"Share this article: {article.get('url', '')}")
+        if save_clicked:
+            save_article(article)
+        if rate_clicked:
+            rate_article(article.get('url', ''), rating)
+            st.success(f"Rated {rating} stars!")
+        if share_clicked:
+            st.write(f"Share this article: {article.get('url', '')}")
     
     with col2:
-        # Article image
-        if article.get('urlToImage'):
+        # Article image, served from the prefetched bytes when available
+        image = st.session_state.get('images', {}).get(article.get('urlToImage'))
+        if image:
+            st.image(image, width=150)
+        elif article.get('urlToImage'):
             st.image(article.get('urlToImage'), width=150)
         else:
             st.image("https://via.placeholder.com/150x100?text=No+Image", width=150)
@@ -395,7 +580,8 @@ def display_saved_articles():
             st.session_state.show_saved = False
         return
     
-    for i, article in enumerate(st.session_state.user_preferences['saved_articles']):
+    saved_articles = st.session_state.user_preferences['saved_articles']
+    for url, article in saved_articles.items():
         st.markdown('<div class="article-card">', unsafe_allow_html=True)
         
         col1, col2 = st.columns([4, 1])
@@ -405,8 +591,8 @@ def display_saved_articles():
             st.caption(f"📅 {article.get('publishedAt', 'Unknown date')} | 📰 {article.get('source', {}).get('name', 'Unknown source')}")
             st.write(article.get('description', 'No description available.'))
             
-            if st.button(f"🗑️ Remove", key=f"remove_{i}"):
-                st.session_state.user_preferences['saved_articles'].pop(i)
+            if st.button(f"🗑️ Remove", key=f"remove_{url}"):
+                saved_articles.pop(url)
                 st.success("Article removed!")
                 st.rerun()
         
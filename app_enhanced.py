@@ -2,9 +2,22 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
+from collections import Counter
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional
+import hashlib
+import html
+import io
 import os
+import re
+import threading
+import requests
 from dotenv import load_dotenv
+from PIL import Image
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 # Import our utility modules
 from utils import NewsAPIClient, GeminiAPIClient, DataManager
@@ -12,6 +25,93 @@ from utils import NewsAPIClient, GeminiAPIClient, DataManager
 # Load environment variables
 load_dotenv()
 
+# Keywords used to categorize fetched articles, checked in priority order
+CATEGORY_KEYWORDS = {
+    'Technology': ('tech', 'ai', 'software', 'digital'),
+    'Business': ('business', 'economy', 'market', 'finance'),
+    'Science': ('science', 'research', 'study'),
+    'Politics': ('politics', 'government', 'election'),
+    'Sports': ('sport', 'football', 'basketball', 'tennis'),
+    'Entertainment': ('movie', 'film', 'music', 'celebrity')
+}
+
+# Navigation views and their selectbox positions
+VIEWS = ('Dashboard', 'Saved Articles', 'Analytics', 'Settings')
+VIEW_INDEX = {view: i for i, view in enumerate(VIEWS)}
+
+# Interest options offered in the dashboard sidebar
+AVAILABLE_CATEGORIES = ('Technology', 'Business', 'Science', 'Politics', 'Sports', 'Entertainment')
+
+# One precompiled alternation per category, searched in priority order
+CATEGORY_PATTERNS = {
+    category: re.compile('|'.join(re.escape(word) for word in words))
+    for category, words in CATEGORY_KEYWORDS.items()
+}
+
+@dataclass(slots=True)
+class Article:
+    """A NewsAPI article flattened once at fetch time for cheap attribute access"""
+    title: str
+    url: str
+    description: str = ''
+    short_desc: str = ''
+    content: str = ''
+    author: str = ''
+    source_name: str = 'Unknown source'
+    published_at: str = 'Unknown date'
+    url_to_image: Optional[str] = None
+    category: str = 'General'
+    ai_summary: Optional[str] = None
+    key_points: List[str] = field(default_factory=list)
+    reading_time: int = 2
+    thumb_bytes: Optional[bytes] = None
+    saved_at: str = ''
+    key: str = ''
+    
+    @classmethod
+    def from_dict(cls, raw):
+        """Build an Article from a NewsAPI or saved-article dict"""
+        return cls(
+            title=raw.get('title') or '',
+            url=raw.get('url') or '',
+            description=raw.get('description') or '',
+            content=raw.get('content') or '',
+            author=raw.get('author') or '',
+            source_name=(raw.get('source') or {}).get('name') or 'Unknown source',
+            published_at=raw.get('publishedAt') or 'Unknown date',
+            url_to_image=raw.get('urlToImage'),
+            category=raw.get('category') or 'General',
+            ai_summary=raw.get('ai_summary'),
+            key_points=raw.get('key_points') or [],
+            reading_time=raw.get('reading_time', 2),
+            saved_at=raw.get('saved_at') or ''
+        )
+    
+    def to_dict(self):
+        """Convert back to the NewsAPI shape stored by DataManager and read by GeminiAPIClient"""
+        raw = {
+            'title': self.title,
+            'url': self.url,
+            'description': self.description,
+            'content': self.content,
+            'author': self.author,
+            'source': {'name': self.source_name},
+            'publishedAt': self.published_at,
+            'urlToImage': self.url_to_image,
+            'category': self.category,
+            'reading_time': self.reading_time
+        }
+        if self.ai_summary:
+            raw['ai_summary'] = self.ai_summary
+        if self.key_points:
+            raw['key_points'] = self.key_points
+        if self.saved_at:
+            raw['saved_at'] = self.saved_at
+        return raw
+
+# Bounding box for article thumbnails, matching the card image width
+THUMBNAIL_SIZE = (150, 100)
+
 # Initialize clients
 @st.cache_resource
 def init_clients():
@@ -25,6 +125,93 @@ def init_clients():
         st.error(f"Error initializing clients: {str(e)}")
         return None, None, None
 
+@st.cache_data(ttl=3600, show_spinner=False)
+def fetch_articles_cached(interests, frequency):
+    """Fetch articles for a tuple of interests, memoized for an hour"""
+    news_client, _, _ = init_clients()
+    articles = news_client.fetch_articles_by_interests(list(interests), frequency)
+    if not articles:
+        # Raise so an empty or failed fetch is never cached
+        raise RuntimeError("No articles fetched")
+    return articles
+
+@st.cache_data(ttl=86400, show_spinner=False)
+def summarize_cached(url, title, description):
+    """Summarize an article, memoized per URL for a day"""
+    _, gemini_client, _ = init_clients()
+    summary = gemini_client.summarize_article_object({'url': url, 'title': title, 'description': description})
+    if not summary or summary.startswith("Summary unavailable"):
+        # Raise so failed summaries are never cached
+        raise RuntimeError(summary or "Empty summary")
+    return summary
+
+# User data is re-read from disk at most once per rerun; writes clear these caches
+@st.cache_data(ttl=2, show_spinner=False)
+def load_saved_cached():
+    """Load saved articles, memoized across the calls of one rerun"""
+    _, _, data_manager = init_clients()
+    return data_manager.load_saved_articles()
+
+@st.cache_data(ttl=2, show_spinner=False)
+def load_ratings_cached():
+    """Load ratings, memoized across the calls of one rerun"""
+    _, _, data_manager = init_clients()
+    return data_manager.load_ratings()
+
+@st.cache_data(ttl=2, show_spinner=False)
+def user_stats_cached():
+    """Compute user stats, memoized across the calls of one rerun"""
+    _, _, data_manager = init_clients()
+    return data_manager.get_user_stats()
+
+def clear_data_caches():
+    """Drop memoized user data after a write"""
+    load_saved_cached.clear()
+    load_ratings_cached.clear()
+    user_stats_cached.clear()
+
+def _fetch_thumbnail(url):
+    """Download an image and shrink it to a PNG thumbnail"""
+    try:
+        response = requests.get(url, timeout=5)
+        response.raise_for_status()
+        image = Image.open(io.BytesIO(response.content))
+        image.thumbnail(THUMBNAIL_SIZE)
+        buffer = io.BytesIO()
+        image.save(buffer, format='PNG')
+        return buffer.getvalue()
+    except Exception as e:
+        print(f"Error fetching thumbnail {url}: {str(e)}")
+        return None
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def fetch_thumbnails(urls):
+    """Download a tuple of image URLs in parallel, returning {url: png bytes}"""
+    if not urls:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(16, len(urls))) as executor:
+        thumbs = dict(zip(urls, executor.map(_fetch_thumbnail, urls)))
+    return {url: thumb for url, thumb in thumbs.items() if thumb}
+
+@st.cache_data(show_spinner=False)
+def category_pie(counts):
+    """Build the category pie chart for a tuple of (category, count) pairs"""
+    return px.pie(
+        values=[count for _, count in counts],
+        names=[category for category, _ in counts],
+        title="Articles by Category"
+    )
+
+@st.cache_data(show_spinner=False)
+def rating_bar(counts):
+    """Build the rating distribution bar chart for a tuple of (rating, count) pairs"""
+    return px.bar(
+        x=[rating for rating, _ in counts],
+        y=[count for _, count in counts],
+        title="Rating Distribution",
+        labels={'x': 'Rating', 'y': 'Count'}
+    )
+
 # Page configuration
 st.set_page_config(
     page_title="News Digest Dashboard",
@@ -34,128 +221,12 @@ st.set_page_config(
 )
 
 # Custom CSS for enhanced styling
-st.markdown("""
-<style>
-    /* Global text color fix */
-    .stApp {
-        color: #2c3e50;
-    }
-    
-    /* Main header with better contrast */
-    .main-header {
-        font-size: 3rem;
-        font-weight: bold;
-        background: linear-gradient(135deg, #2c3e50 0%, #34495e 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        text-align: center;
-        margin-bottom: 2rem;
-    }
-    
-    /* Category cards with dark text on light background */
-    .category-card {
-        background: linear-gradient(135deg, #ecf0f1 0%, #bdc3c7 100%);
-        color: #2c3e50;
-        padding: 1rem;
-        border-radius: 15px;
-        margin: 0.5rem 0;
-        box-shadow: 0 4px 15px rgba(0,0,0,0.1);
-        border: 1px solid #bdc3c7;
-    }
-    
-    /* Article cards with proper contrast */
-    .article-card {
-        background: #ffffff;
-        color: #2c3e50;
-        padding: 1.5rem;
-        border-radius: 15px;
-        margin: 1rem 0;
-        box-shadow: 0 4px 15px rgba(0,0,0,0.1);
-        border: 1px solid #e0e0e0;
-        transition: transform 0.2s;
-    }
-    .article-card:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 6px 20px rgba(0,0,0,0.15);
-    }
-    
-    /* Summary box with dark text */
-    .summary-box {
-        background: linear-gradient(135deg, #e8f4f8 0%, #f0f8ff 100%);
-        color: #2c3e50;
-        padding: 1rem;
-        border-radius: 10px;
-        margin: 1rem 0;
-        border-left: 4px solid #3498db;
-    }
-    
-    /* Metric cards with white text on dark background */
-    .metric-card {
-        background: linear-gradient(135deg, #3498db 0%, #2980b9 100%);
-        color: white;
-        padding: 1.5rem;
-        border-radius: 15px;
-        text-align: center;
-        box-shadow: 0 4px 15px rgba(0,0,0,0.1);
-    }
-    
-    /* Buttons with better styling */
-    .stButton > button {
-        background: linear-gradient(135deg, #3498db 0%, #2980b9 100%);
-        color: white;
-        border-radius: 25px;
-        padding: 0.5rem 2rem;
-        border: none;
-        box-shadow: 0 4px 15px rgba(0,0,0,0.1);
-        transition: all 0.3s;
-        font-weight: 600;
-    }
-    .stButton > button:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 6px 20px rgba(0,0,0,0.15);
-        background: linear-gradient(135deg, #2980b9 0%, #1f5f8b 100%);
-    }
-    
-    /* Sidebar headers */
-    .sidebar-header {
-        background: linear-gradient(135deg, #34495e 0%, #2c3e50 100%);
-        color: white;
-        padding: 1rem;
-        border-radius: 10px;
-        margin-bottom: 1rem;
-    }
-    
-    /* Stats container with better contrast */
-    .stats-container {
-        background: rgba(52, 73, 94, 0.1);
-        color: #2c3e50;
-        padding: 1rem;
-        border-radius: 10px;
-        margin: 0.5rem 0;
-        border: 1px solid #bdc3c7;
-    }
-    
-    /* Fix for Streamlit text elements */
-    .stMarkdown, .stText {
-        color: #2c3e50 !important;
-    }
-    
-    /* Fix for sidebar text */
-    .css-1d391kg {
-        color: #2c3e50 !important;
-    }
-    
-    /* Better contrast for selectboxes and inputs */
-    .stSelectbox > div > div {
-        color: #2c3e50 !important;
-    }
-    
-    /* Fix for multiselect */
-    .stMultiSelect > div > div {
-        color: #2c3e50 !important;
-    }
-</style>
-""", unsafe_allow_html=True)
+@st.cache_resource
+def _css():
+    """Read the stylesheet once per process"""
+    return (Path(__file__).parent / 'assets' / 'enhanced.css').read_text()
+
+st.markdown(f"<style>{_css()}</style>", unsafe_allow_html=True)
 
 def main():
     # Initialize clients
@@ -179,32 +250,35 @@ def main():
         # Navigation menu
         view = st.selectbox(
             "Choose View:",
-            ['Dashboard', 'Saved Articles', 'Analytics', 'Settings'],
-            index=['Dashboard', 'Saved Articles', 'Analytics', 'Settings'].index(st.session_state.current_view)
+            VIEWS,
+            index=VIEW_INDEX[st.session_state.current_view]
         )
+        st.session_state.current_view = view
         
-        if view == 'Dashboard':
-            st.session_state.current_view = 'Dashboard'
-            show_dashboard_sidebar(news_client, gemini_client, data_manager)
-        elif view == 'Saved Articles':
-            st.session_state.current_view = 'Saved Articles'
-            show_saved_sidebar(data_manager)
-        elif view == 'Analytics':
-            st.session_state.current_view = 'Analytics'
-            show_analytics_sidebar(data_manager)
-        elif view == 'Settings':
-            st.session_state.current_view = 'Settings'
-            show_settings_sidebar(data_manager)
+        # Sidebar and main-area renderers for each view
+        show_view_sidebar, show_view = {
+            'Dashboard': (
+                lambda: show_dashboard_sidebar(news_client, gemini_client, data_manager),
+                lambda: show_dashboard(news_client, gemini_client, data_manager)
+            ),
+            'Saved Articles': (
+                lambda: show_saved_sidebar(data_manager),
+                lambda: show_saved_articles(gemini_client, data_manager)
+            ),
+            'Analytics': (
+                lambda: show_analytics_sidebar(data_manager),
+                lambda: show_analytics(data_manager)
+            ),
+            'Settings': (
+                lambda: show_settings_sidebar(data_manager),
+                lambda: show_settings(news_client, gemini_client, data_manager)
+            )
+        }[view]
+        
+        show_view_sidebar()
     
     # Main content area
-    if st.session_state.current_view == 'Dashboard':
-        show_dashboard(news_client, gemini_client, data_manager)
-    elif st.session_state.current_view == 'Saved Articles':
-        show_saved_articles(gemini_client, data_manager)
-    elif st.session_state.current_view == 'Analytics':
-        show_analytics(data_manager)
-    elif st.session_state.current_view == 'Settings':
-        show_settings(data_manager)
+    show_view()
 
 def show_dashboard_sidebar(news_client, gemini_client, data_manager):
     """Show dashboard sidebar with preferences"""
@@ -213,36 +287,41 @@ def show_dashboard_sidebar(news_client, gemini_client, data_manager):
     # Load current preferences
     preferences = data_manager.load_user_preferences()
     
-    # Interest selection
-    st.subheader("📂 Select Interests")
-    available_categories = ['Technology', 'Business', 'Science', 'Politics', 'Sports', 'Entertainment']
-    selected_interests = st.multiselect(
-        "Choose news categories:",
-        available_categories,
-        default=preferences.get('interests', [])
-    )
-    
-    # Frequency selection
-    st.subheader("📅 Update Frequency")
-    frequency = st.selectbox(
-        "How often would you like updates?",
-        ['daily', 'weekly'],
-        index=0 if preferences.get('frequency') == 'daily' else 1
-    )
-    
-    # Article Processing Options
-    st.markdown('<div class="stats-container">', unsafe_allow_html=True)
-    st.subheader("📊 Article Processing Options")
-    
-    max_articles = st.slider("📊 Max Articles to Fetch", 5, 20, 10, help="More articles = longer loading time")
-    
-    # Show AI status
-    st.info("💡 AI Summaries are now available on-demand! Click the 🤖 AI Summary button on any article to generate a smart summary.")
-    
-    st.markdown('</div>', unsafe_allow_html=True)
+    # Preference widgets live in a form so changing them doesn't rerun the script
+    with st.form('prefs'):
+        # Interest selection
+        st.subheader("📂 Select Interests")
+        selected_interests = st.multiselect(
+            "Choose news categories:",
+            AVAILABLE_CATEGORIES,
+            default=preferences.get('interests', [])
+        )
+        
+        # Frequency selection
+        st.subheader("📅 Update Frequency")
+        frequency = st.selectbox(
+            "How often would you like updates?",
+            ['daily', 'weekly'],
+            index=0 if preferences.get('frequency') == 'daily' else 1
+        )
+        
+        # Article Processing Options
+        st.markdown('<div class="stats-container">', unsafe_allow_html=True)
+        st.subheader("📊 Article Processing Options")
+        
+        max_articles = st.slider("📊 Max Articles to Fetch", 5, 20, 10, help="More articles = longer loading time")
+        
+        generate_summaries = st.checkbox("🤖 Generate AI summaries while fetching", value=False, help="Summarizes every fetched article in parallel")
+        
+        # Show AI status
+        st.info("💡 AI Summaries are now available on-demand! Click the 🤖 AI Summary button on any article to generate a smart summary.")
+        
+        st.markdown('</div>', unsafe_allow_html=True)
+        
+        submitted = st.form_submit_button("🔄 Update & Fetch News")
     
     # Update preferences
-    if st.button("🔄 Update & Fetch News"):
+    if submitted:
         with st.spinner("Updating preferences and fetching news..."):
             # Save preferences
             preferences['interests'] = selected_interests
@@ -253,40 +332,69 @@ def show_dashboard_sidebar(news_client, gemini_client, data_manager):
             if selected_interests:
                 # Step 1: Fetch articles
                 st.info("📡 Fetching articles from NewsAPI...")
-                articles = news_client.fetch_articles_by_interests(selected_interests, frequency)
+                try:
+                    raw_articles = fetch_articles_cached(tuple(selected_interests), frequency)
+                except RuntimeError:
+                    raw_articles = []
                 
-                if articles:
-                    # Limit articles for faster processing
-                    articles = articles[:max_articles]
+                if raw_articles:
+                    # Limit articles for faster processing and flatten them once
+                    articles = [Article.from_dict(raw) for raw in raw_articles[:max_articles]]
                     
-                    # Step 2: Add basic categorization
+                    # Step 2: Add basic categorization and the display-only fields in one pass
                     st.info("🏷️ Categorizing articles...")
                     for article in articles:
                         # Simple categorization based on title/description
-                        title_lower = article.get('title', '').lower()
-                        desc_lower = article.get('description', '').lower()
+                        text = f"{article.title} {article.description}".lower()
+                        article.category = next(
+                            (category for category, pattern in CATEGORY_PATTERNS.items() if pattern.search(text)),
+                            'General'
+                        )
+                        
+                        description = article.description or 'No description available.'
+                        article.short_desc = description[:200] + "..." if len(description) > 200 else description
+                        article.reading_time = max(1, (len(article.title) + len(article.description)) // 200)  # Rough estimate
+                    
+                    # Step 3: Optionally summarize all articles in one batched request
+                    if generate_summaries:
+                        st.info("🤖 Generating AI summaries...")
+                        for result in gemini_client.summarize_batch([article.to_dict() for article in articles]):
+                            articles[result['id']].ai_summary = result['summary']
                         
-                        if any(word in title_lower or word in desc_lower for word in ['tech', 'ai', 'software', 'digital']):
-                            article['category'] = 'Technology'
-                        elif any(word in title_lower or word in desc_lower for word in ['business', 'economy', 'market', 'finance']):
-                            article['category'] = 'Business'
-                        elif any(word in title_lower or word in desc_lower for word in ['science', 'research', 'study']):
-                            article['category'] = 'Science'
-                        elif any(word in title_lower or word in desc_lower for word in ['politics', 'government', 'election']):
-                            article['category'] = 'Politics'
-                        elif any(word in title_lower or word in desc_lower for word in ['sport', 'football', 'basketball', 'tennis']):
-                            article['category'] = 'Sports'
-                        elif any(word in title_lower or word in desc_lower for word in ['movie', 'film', 'music', 'celebrity']):
-                            article['category'] = 'Entertainment'
-                        else:
-                            article['category'] = 'General'
+                        # Fall back to parallel per-article requests for anything the batch missed
+                        missing = [article for article in articles if not article.ai_summary]
+                        if missing:
+                            progress_bar = st.progress(0)
+                            ctx = get_script_run_ctx()
+                            
+                            def summarize_in_worker(article):
+                                # Worker threads need the script context to reach summarize_cached
+                                add_script_run_ctx(threading.current_thread(), ctx)
+                                return summarize_cached(article.url, article.title, article.description or article.content)
+                            
+                            with ThreadPoolExecutor(max_workers=min(8, len(missing))) as executor:
+                                futures = {executor.submit(summarize_in_worker, article): article for article in missing}
+                                for i, future in enumerate(as_completed(futures)):
+                                    article = futures[future]
+                                    try:
+                                        summary = future.result()
+                                        if summary and not summary.startswith("Summary unavailable"):
+                                            article.ai_summary = summary
+                                    except Exception as e:
+                                        st.warning(f"Could not summarize '{article.title or 'Unknown'}': {str(e)}")
+                                    progress_bar.progress((i + 1) / len(missing))
                     
-                    # Add basic reading time estimation for all articles
+                    # Download every thumbnail once so reruns render from memory
+                    thumbs = fetch_thumbnails(tuple(sorted({article.url_to_image for article in articles if article.url_to_image})))
                     for article in articles:
-                        text_length = len(article.get('title', '') + article.get('description', ''))
-                        article['reading_time'] = max(1, text_length // 200)  # Rough estimate
+                        article.thumb_bytes = thumbs.get(article.url_to_image)
+                    
+                    # Precompute stable widget keys once instead of hashing on every rerun
+                    for idx, article in enumerate(articles):
+                        article.key = hashlib.blake2b(f"{article.url}{idx}".encode(), digest_size=4).hexdigest()
                     
                     st.session_state.news_data = articles
+                    st.session_state.last_updated = datetime.now().strftime("%H:%M")
                     st.success(f"✅ Fetched {len(articles)} articles!")
                 else:
                     st.error("No articles found. Please try different interests or check your API key.")
@@ -297,7 +405,7 @@ def show_dashboard_sidebar(news_client, gemini_client, data_manager):
     st.markdown('<div class="stats-container">', unsafe_allow_html=True)
     st.subheader("📊 Quick Stats")
     
-    user_stats = data_manager.get_user_stats()
+    user_stats = user_stats_cached()
     col1, col2 = st.columns(2)
     
     with col1:
@@ -323,83 +431,130 @@ def show_dashboard(news_client, gemini_client, data_manager):
     
     with col2:
         st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-        categories_count = len(set(article.get('category', 'Unknown') for article in st.session_state.get('news_data', [])))
+        categories_count = len({article.category for article in st.session_state.get('news_data', [])})
         st.metric("Categories", categories_count)
         st.markdown('</div>', unsafe_allow_html=True)
     
     with col3:
         st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-        user_stats = data_manager.get_user_stats()
+        user_stats = user_stats_cached()
         st.metric("Avg Rating", f"{user_stats.get('average_rating', 0):.1f}/5")
         st.markdown('</div>', unsafe_allow_html=True)
     
     with col4:
         st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-        st.metric("Last Updated", datetime.now().strftime("%H:%M"))
+        st.metric("Last Updated", st.session_state.get('last_updated', '—'))
         st.markdown('</div>', unsafe_allow_html=True)
     
     # News feed
     if st.session_state.get('news_data'):
         st.header("📰 Your Personalized News Feed")
         
-        # Categorize articles
-        categorized_articles = {}
-        for article in st.session_state.news_data:
-            category = article.get('category', 'General')
-            if category not in categorized_articles:
-                categorized_articles[category] = []
-            categorized_articles[category].append(article)
+        news_data = st.session_state.news_data
+        
+        # The table renders the whole feed as one element; cards add per-article widgets
+        layout = st.radio("Feed layout", ['Table', 'Cards'], horizontal=True)
         
-        # Display articles by category
-        for category, articles in categorized_articles.items():
-            st.markdown(f'<div class="category-card"><h3>📂 {category} ({len(articles)} articles)</h3></div>', unsafe_allow_html=True)
+        if layout == 'Table':
+            display_feed_table(news_data, data_manager)
+        else:
+            # Group articles by category in first-seen order
+            groups = {}
+            for article in news_data:
+                groups.setdefault(article.category, []).append(article)
             
-                         for i, article in enumerate(articles):
-                 display_enhanced_article_card(article, gemini_client, data_manager, i)
+            # Display articles by category
+            for category, articles in groups.items():
+                st.markdown(f'<div class="category-card"><h3>📂 {category} ({len(articles)} articles)</h3></div>', unsafe_allow_html=True)
+                
+                for article in articles:
+                    display_enhanced_article_card(article, gemini_client, data_manager)
     else:
         st.info("👆 Select your interests and update preferences to see your personalized news feed!")
 
-def display_enhanced_article_card(article, gemini_client, data_manager, index=0):
+def display_feed_table(articles, data_manager):
+    """Display the feed as a single editable table with bulk save and rating"""
+    feed_df = pd.DataFrame({
+        'save': [False] * len(articles),
+        'rating': pd.Series([None] * len(articles), dtype='Int64'),
+        'image': [article.url_to_image for article in articles],
+        'title': [article.title for article in articles],
+        'source_name': [article.source_name for article in articles],
+        'category': [article.category for article in articles],
+        'reading_time': [article.reading_time for article in articles],
+        'url': [article.url for article in articles]
+    })
+    
+    # Edits are held client-side until the form is submitted
+    with st.form('feed_table'):
+        edited_df = st.data_editor(
+            feed_df,
+            column_config={
+                'save': st.column_config.CheckboxColumn("💾"),
+                'rating': st.column_config.SelectboxColumn("⭐", options=[1, 2, 3, 4, 5]),
+                'image': st.column_config.ImageColumn(""),
+                'title': st.column_config.TextColumn("Title", width="large"),
+                'source_name': "Source",
+                'category': "Category",
+                'reading_time': st.column_config.NumberColumn("⏱️ Min", format="%d"),
+                'url': st.column_config.LinkColumn("Open")
+            },
+            disabled=['image', 'title', 'source_name', 'category', 'reading_time', 'url'],
+            hide_index=True,
+            use_container_width=True
+        )
+        submitted = st.form_submit_button("💾 Save selected & submit ratings")
+    
+    if submitted:
+        saved_count = 0
+        rated_count = 0
+        for article, save, rating in zip(articles, edited_df['save'], edited_df['rating']):
+            if save and data_manager.save_article(article.to_dict()):
+                saved_count += 1
+            if pd.notna(rating):
+                data_manager.save_rating(article.url, int(rating))
+                rated_count += 1
+        clear_data_caches()
+        st.success(f"Saved {saved_count} articles and submitted {rated_count} ratings!")
+
+def display_enhanced_article_card(article, gemini_client, data_manager):
     """Display an enhanced article card with more features"""
-    # Create unique key using article title, URL, and index
-    import hashlib
-    unique_string = f"{article.get('title', '')}{article.get('url', '')}{index}"
-    article_key = hashlib.md5(unique_string.encode()).hexdigest()[:8]
-    
-    st.markdown('<div class="article-card">', unsafe_allow_html=True)
+    # Unique key precomputed when the articles were fetched
+    article_key = article.key
     
     col1, col2 = st.columns([3, 1])
     
     with col1:
-        st.subheader(article.get('title', 'No title'))
+        # Static card content is emitted as a single element
+        title = html.escape(article.title or 'No title')
+        published_date = html.escape(article.published_at)
+        source_name = html.escape(article.source_name)
+        reading_time = article.reading_time
+        description = html.escape(article.short_desc)
         
-        # Article metadata
-        published_date = article.get('publishedAt', 'Unknown date')
-        source_name = article.get('source', {}).get('name', 'Unknown source')
-        reading_time = article.get('reading_time', 2)
+        summary_html = ''
+        if article.ai_summary:
+            summary_html = f'<div class="summary-box"><strong>🤖 AI Summary:</strong><br>{html.escape(article.ai_summary)}</div>'
         
-        st.caption(f"📅 {published_date} | 📰 {source_name} | ⏱️ {reading_time} min read")
+        points_html = ''
+        if article.key_points:
+            items = ''.join(f'<li>{html.escape(point)}</li>' for point in article.key_points[:3])
+            points_html = f'<h4>🔑 Key Points:</h4><ul>{items}</ul>'
         
-        # Article description
-        description = article.get('description', 'No description available.')
-        st.write(description[:200] + "..." if len(description) > 200 else description)
-        
-        # AI Summary (if available)
-        if article.get('ai_summary'):
-            st.markdown(f'<div class="summary-box"><strong>🤖 AI Summary:</strong><br>{article.get("ai_summary")}</div>', unsafe_allow_html=True)
-        
-        # Key points (if available)
-        if article.get('key_points'):
-            st.subheader("🔑 Key Points:")
-            for point in article.get('key_points', [])[:3]:
-                st.write(f"• {point}")
+        st.markdown(
+            f'<div class="article-card"><h3>{title}</h3>'
+            f'<p class="article-meta">📅 {published_date} | 📰 {source_name} | ⏱️ {reading_time} min read</p>'
+            f'<p>{description}</p>{summary_html}{points_html}</div>',
+            unsafe_allow_html=True
+        )
         
         # Article actions
         col_action1, col_action2, col_action3, col_action4, col_action5 = st.columns(5)
         
         with col_action1:
             if st.button("💾 Save", key=f"save_{article_key}"):
-                if data_manager.save_article(article):
+                if data_manager.save_article(article.to_dict()):
+                    clear_data_caches()
                     st.success("Saved!")
                 else:
                     st.info("Already saved!")
@@ -407,25 +562,30 @@ def display_enhanced_article_card(article, gemini_client, data_manager, index=0)
         with col_action2:
             rating = st.selectbox("⭐ Rate", [1, 2, 3, 4, 5], key=f"rate_{article_key}")
             if st.button("Submit", key=f"submit_rate_{article_key}"):
-                data_manager.save_rating(article.get('url', ''), rating)
+                data_manager.save_rating(article.url, rating)
+                clear_data_caches()
                 st.success(f"Rated {rating} stars!")
         
         with col_action3:
             if st.button("📤 Share", key=f"share_{article_key}"):
-                st.write(f"Share this article: {article.get('url', '')}")
+                st.write(f"Share this article: {article.url}")
         
         with col_action4:
             if st.button("🔗 Open", key=f"open_{article_key}"):
-                st.markdown(f"[Open Article]({article.get('url', '')})")
+                st.markdown(f"[Open Article]({article.url})")
         
         with col_action5:
-            if not article.get('ai_summary'):
+            if not article.ai_summary:
                 if st.button("🤖 AI Summary", key=f"ai_summary_{article_key}"):
                     with st.spinner("Generating AI summary..."):
                         try:
-                            summary = gemini_client.summarize_article_object(article)
+                            summary = summarize_cached(
+                                article.url,
+                                article.title,
+                                article.description or article.content
+                            )
                             if summary and not summary.startswith("Summary unavailable"):
-                                article['ai_summary'] = summary
+                                article.ai_summary = summary
                                 st.success("AI Summary generated!")
                                 st.rerun()
                             else:
@@ -437,30 +597,32 @@ def display_enhanced_article_card(article, gemini_client, data_manager, index=0)
     
     with col2:
         # Article image
-        if article.get('urlToImage'):
-            st.image(article.get('urlToImage'), width=150)
+        if article.thumb_bytes:
+            st.image(article.thumb_bytes, width=150)
+        elif article.url_to_image:
+            # Download or decode failed; let the browser fetch the original
+            st.image(article.url_to_image, width=150)
         else:
             st.image("https://via.placeholder.com/150x100?text=No+Image", width=150)
-    
-    st.markdown('</div>', unsafe_allow_html=True)
 
 def show_saved_sidebar(data_manager):
     """Show saved articles sidebar"""
     st.markdown('<div class="sidebar-header"><h3>📚 Saved Articles</h3></div>', unsafe_allow_html=True)
     
-    saved_articles = data_manager.load_saved_articles()
+    saved_articles = load_saved_cached()
     st.metric("Total Saved", len(saved_articles))
     
     if st.button("🗑️ Clear All Saved"):
         if st.button("Confirm Clear"):
             data_manager.clear_all_data()
+            clear_data_caches()
             st.success("All saved articles cleared!")
 
 def show_saved_articles(gemini_client, data_manager):
     """Show saved articles view"""
     st.header("📚 Your Saved Articles")
     
-    saved_articles = data_manager.load_saved_articles()
+    saved_articles = [Article.from_dict(raw) for raw in load_saved_cached()]
     
     if not saved_articles:
         st.info("No saved articles yet. Start reading and save interesting articles!")
@@ -469,7 +631,7 @@ def show_saved_articles(gemini_client, data_manager):
     # Filter options
     col1, col2 = st.columns(2)
     with col1:
-        categories = list(set(article.get('category', 'Unknown') for article in saved_articles))
+        categories = sorted({article.category for article in saved_articles})
         selected_category = st.selectbox("Filter by Category", ['All'] + categories)
     
     with col2:
@@ -478,74 +640,83 @@ def show_saved_articles(gemini_client, data_manager):
     # Filter and sort articles
     filtered_articles = saved_articles
     if selected_category != 'All':
-        filtered_articles = [a for a in saved_articles if a.get('category') == selected_category]
-    
-    # Sort articles
-    if sort_by == 'Date Saved':
-        filtered_articles.sort(key=lambda x: x.get('saved_at', ''), reverse=True)
-    elif sort_by == 'Title':
-        filtered_articles.sort(key=lambda x: x.get('title', ''))
-    elif sort_by == 'Category':
-        filtered_articles.sort(key=lambda x: x.get('category', ''))
-    
-            # Display articles
-        for i, article in enumerate(filtered_articles):
-            st.markdown('<div class="article-card">', unsafe_allow_html=True)
+        filtered_articles = [article for article in saved_articles if article.category == selected_category]
+    
+    # Sort articles on a key list extracted once
+    sort_field = {'Date Saved': 'saved_at', 'Title': 'title', 'Category': 'category'}[sort_by]
+    keys = [getattr(article, sort_field) for article in filtered_articles]
+    order = sorted(range(len(keys)), key=keys.__getitem__, reverse=(sort_by == 'Date Saved'))
+    filtered_articles = [filtered_articles[i] for i in order]
+    
+    # Thumbnails are cached per URL set, so reruns and re-sorting don't re-download them
+    thumbs = fetch_thumbnails(tuple(sorted({article.url_to_image for article in filtered_articles if article.url_to_image})))
+    
+    # Display articles
+    for i, article in enumerate(filtered_articles):
+        st.markdown('<div class="article-card">', unsafe_allow_html=True)
+        
+        col1, col2 = st.columns([4, 1])
+        
+        with col1:
+            st.subheader(article.title or 'No title')
+            st.caption(f"📅 {article.published_at} | 📰 {article.source_name}")
+            st.write(article.description or 'No description available.')
             
-            col1, col2 = st.columns([4, 1])
+            # Show AI summary if available
+            if article.ai_summary:
+                st.markdown(f'<div class="summary-box"><strong>🤖 AI Summary:</strong><br>{article.ai_summary}</div>', unsafe_allow_html=True)
             
-            with col1:
-                st.subheader(article.get('title', 'No title'))
-                st.caption(f"📅 {article.get('publishedAt', 'Unknown date')} | 📰 {article.get('source', {}).get('name', 'Unknown source')}")
-                st.write(article.get('description', 'No description available.'))
-                
-                # Show AI summary if available
-                if article.get('ai_summary'):
-                    st.markdown(f'<div class="summary-box"><strong>🤖 AI Summary:</strong><br>{article.get("ai_summary")}</div>', unsafe_allow_html=True)
-                
-                # Action buttons
-                col_btn1, col_btn2, col_btn3 = st.columns(3)
-                
-                with col_btn1:
-                    if st.button(f"🗑️ Remove", key=f"remove_{i}"):
-                        data_manager.remove_saved_article(article.get('url', ''))
-                        st.success("Article removed!")
-                        st.rerun()
-                
-                with col_btn2:
-                    if not article.get('ai_summary'):
-                        if st.button(f"🤖 AI Summary", key=f"ai_summary_saved_{i}"):
-                            with st.spinner("Generating AI summary..."):
-                                try:
-                                    summary = gemini_client.summarize_article_object(article)
-                                    if summary and not summary.startswith("Summary unavailable"):
-                                        article['ai_summary'] = summary
-                                        # Update saved article with AI summary
-                                        data_manager.update_saved_article(article)
-                                        st.success("AI Summary generated and saved!")
-                                        st.rerun()
-                                    else:
-                                        st.error("Could not generate AI summary")
-                                except Exception as e:
-                                    st.error(f"AI Summary failed: {str(e)}")
-                    else:
-                        st.success("✅ AI Summary ready")
-                
-                with col_btn3:
-                    if st.button(f"📤 Share", key=f"share_saved_{i}"):
-                        st.write(f"Share this article: {article.get('url', '')}")
+            # Action buttons
+            col_btn1, col_btn2, col_btn3 = st.columns(3)
             
-            with col2:
-                if article.get('urlToImage'):
-                    st.image(article.get('urlToImage'), width=100)
+            with col_btn1:
+                if st.button(f"🗑️ Remove", key=f"remove_{i}"):
+                    data_manager.remove_saved_article(article.url)
+                    clear_data_caches()
+                    st.success("Article removed!")
+                    st.rerun()
             
-            st.markdown('</div>', unsafe_allow_html=True)
+            with col_btn2:
+                if not article.ai_summary:
+                    if st.button(f"🤖 AI Summary", key=f"ai_summary_saved_{i}"):
+                        with st.spinner("Generating AI summary..."):
+                            try:
+                                summary = summarize_cached(
+                                    article.url,
+                                    article.title,
+                                    article.description or article.content
+                                )
+                                if summary and not summary.startswith("Summary unavailable"):
+                                    article.ai_summary = summary
+                                    # Update saved article with AI summary
+                                    data_manager.update_saved_article(article.to_dict())
+                                    clear_data_caches()
+                                    st.success("AI Summary generated and saved!")
+                                    st.rerun()
+                                else:
+                                    st.error("Could not generate AI summary")
+                            except Exception as e:
+                                st.error(f"AI Summary failed: {str(e)}")
+                else:
+                    st.success("✅ AI Summary ready")
+            
+            with col_btn3:
+                if st.button(f"📤 Share", key=f"share_saved_{i}"):
+                    st.write(f"Share this article: {article.url}")
+        
+        with col2:
+            if article.url_to_image in thumbs:
+                st.image(thumbs[article.url_to_image], width=100)
+            elif article.url_to_image:
+                st.image(article.url_to_image, width=100)
+        
+        st.markdown('</div>', unsafe_allow_html=True)
 
 def show_analytics_sidebar(data_manager):
     """Show analytics sidebar"""
     st.markdown('<div class="sidebar-header"><h3>📊 Analytics</h3></div>', unsafe_allow_html=True)
     
-    user_stats = data_manager.get_user_stats()
+    user_stats = user_stats_cached()
     st.metric("Total Articles", user_stats.get('total_saved_articles', 0))
     st.metric("Average Rating", f"{user_stats.get('average_rating', 0):.1f}")
 
@@ -553,9 +724,9 @@ def show_analytics(data_manager):
     """Show analytics view"""
     st.header("📊 Your Reading Analytics")
     
-    user_stats = data_manager.get_user_stats()
-    saved_articles = data_manager.load_saved_articles()
-    ratings = data_manager.load_ratings()
+    user_stats = user_stats_cached()
+    saved_articles = load_saved_cached()
+    ratings = load_ratings_cached()
     
     # Overview metrics
     col1, col2, col3, col4 = st.columns(4)
@@ -586,34 +757,19 @@ def show_analytics(data_manager):
         
         with col1:
             # Category distribution
-            category_counts = {}
-            for article in saved_articles:
-                category = article.get('category', 'Unknown')
-                category_counts[category] = category_counts.get(category, 0) + 1
+            category_counts = Counter(article.get('category') or 'General' for article in saved_articles)
             
             if category_counts:
-                fig = px.pie(
-                    values=list(category_counts.values()),
-                    names=list(category_counts.keys()),
-                    title="Articles by Category"
-                )
+                fig = category_pie(tuple(sorted(category_counts.items())))
                 st.plotly_chart(fig, use_container_width=True)
         
         with col2:
             # Rating distribution
             if ratings:
-                rating_counts = {}
-                for rating_data in ratings.values():
-                    rating = rating_data.get('rating', 0)
-                    rating_counts[rating] = rating_counts.get(rating, 0) + 1
+                rating_counts = Counter(rating_data.get('rating', 0) for rating_data in ratings.values())
                 
                 if rating_counts:
-                    fig = px.bar(
-                        x=list(rating_counts.keys()),
-                        y=list(rating_counts.values()),
-                        title="Rating Distribution",
-                        labels={'x': 'Rating', 'y': 'Count'}
-                    )
+                    fig = rating_bar(tuple(sorted(rating_counts.items())))
                     st.plotly_chart(fig, use_container_width=True)
 
 def show_settings_sidebar(data_manager):
@@ -624,7 +780,7 @@ def show_settings_sidebar(data_manager):
     total_size = sum(data_sizes.values())
     st.metric("Data Size", f"{total_size / 1024:.1f} KB")
 
-def show_settings(data_manager):
+def show_settings(news_client, gemini_client, data_manager):
     """Show settings view"""
     st.header("⚙️ Application Settings")
     
@@ -645,6 +801,7 @@ def show_settings(data_manager):
         if st.button("🗑️ Clear All Data"):
             if st.button("⚠️ Confirm Clear All"):
                 if data_manager.clear_all_data():
+                    clear_data_caches()
                     st.success("All data cleared!")
                 else:
                     st.error("Failed to clear data")
@@ -660,8 +817,6 @@ def show_settings(data_manager):
     st.subheader("🔗 API Status")
     
     try:
-        news_client, gemini_client, _ = init_clients()
-        
         col1, col2 = st.columns(2)
         
         with col1:
@@ -6,8 +6,12 @@ Shows the application features with sample data
 
 import streamlit as st
 import pandas as pd
+from collections import defaultdict
 from datetime import datetime, timedelta
+import base64
+import html
 import json
+from pathlib import Path
 
 # Page configuration
 st.set_page_config(
@@ -18,43 +22,76 @@ st.set_page_config(
 )
 
 # Custom CSS
-st.markdown("""
-<style>
-    .main-header {
-        font-size: 3rem;
-        font-weight: bold;
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        text-align: center;
-        margin-bottom: 2rem;
-    }
-    .demo-card {
-        background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
-        color: white;
-        padding: 1rem;
-        border-radius: 15px;
-        margin: 0.5rem 0;
-        box-shadow: 0 4px 15px rgba(0,0,0,0.1);
-    }
-    .article-card {
-        background: white;
-        padding: 1.5rem;
-        border-radius: 15px;
-        margin: 1rem 0;
-        box-shadow: 0 4px 15px rgba(0,0,0,0.1);
-        border: 1px solid #e0e0e0;
-    }
-    .metric-card {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        padding: 1.5rem;
-        border-radius: 15px;
-        text-align: center;
-        box-shadow: 0 4px 15px rgba(0,0,0,0.1);
-    }
-</style>
-""", unsafe_allow_html=True)
+@st.cache_resource
+def _css():
+    """Read the stylesheet once per process"""
+    return (Path(__file__).parent / 'assets' / 'demo.css').read_text()
+
+# st.html inserts the stylesheet as-is, skipping the markdown parser
+st.html(f"<style>{_css()}</style>")
+
+# Number of cards rendered initially and added per "Load more" click
+PAGE_SIZE = 3
+
+# Features showcase and setup instructions never change between reruns
+STATIC_FOOTER_HTML = """
+<h2>🚀 Application Features</h2>
+<div class="feature-grid">
+  <div>
+    <h3>🤖 AI-Powered Features</h3>
+    <ul>
+      <li><strong>Smart Summarization</strong>: AI-generated article summaries</li>
+      <li><strong>Key Points Extraction</strong>: Automatic identification of main points</li>
+      <li><strong>Reading Time Estimation</strong>: Time estimates for each article</li>
+      <li><strong>Content Categorization</strong>: Automatic article classification</li>
+    </ul>
+  </div>
+  <div>
+    <h3>📊 User Features</h3>
+    <ul>
+      <li><strong>Personalized Feed</strong>: Articles based on your interests</li>
+      <li><strong>Save &amp; Rate</strong>: Save articles and rate them</li>
+      <li><strong>Analytics Dashboard</strong>: Track your reading patterns</li>
+      <li><strong>Share Functionality</strong>: Share articles with others</li>
+    </ul>
+  </div>
+</div>
+<h2>🔧 Get Started</h2>
+<div class="info-box">
+  <p><strong>To use the full application with real news:</strong></p>
+  <ol>
+    <li><strong>Get API Keys</strong>:
+      <ul>
+        <li>NewsAPI: <a href="https://newsapi.org/">https://newsapi.org/</a></li>
+        <li>Gemini API: <a href="https://makersuite.google.com/app/apikey">https://makersuite.google.com/app/apikey</a></li>
+      </ul>
+    </li>
+    <li><strong>Set up the application</strong>:
+<pre><code>python deploy.py setup
+# Edit .env file with your API keys
+python deploy.py test
+python deploy.py start</code></pre>
+    </li>
+    <li><strong>Deploy to production</strong>:
+      <ul>
+        <li>Streamlit Cloud: share.streamlit.io</li>
+        <li>Netlify: netlify.com</li>
+        <li>Google Colab: Use the provided notebook</li>
+      </ul>
+    </li>
+  </ol>
+</div>
+"""
+
+def placeholder_image(text):
+    """Build an inline SVG placeholder image as a data URI"""
+    svg = (
+        '<svg xmlns="http://www.w3.org/2000/svg" width="400" height="200">'
+        '<rect width="100%" height="100%" fill="#cccccc"/>'
+        '<text x="50%" y="50%" dominant-baseline="middle" text-anchor="middle" '
+        f'font-family="sans-serif" font-size="28" fill="#666666">{html.escape(text)}</text></svg>'
+    )
+    return f"data:image/svg+xml;base64,{base64.b64encode(svg.encode()).decode()}"
 
 # Sample data
 SAMPLE_ARTICLES = [
@@ -64,7 +101,7 @@ SAMPLE_ARTICLES = [
         "source": {"name": "Tech News Daily"},
         "publishedAt": "2024-01-15T10:30:00Z",
         "url": "https://example.com/ai-breakthrough",
-        "urlToImage": "https://via.placeholder.com/400x200?text=AI+Breakthrough",
+        "urlToImage": placeholder_image("AI Breakthrough"),
         "category": "Technology",
         "ai_summary": "A revolutionary AI model has achieved human-level performance in language understanding and reasoning tasks, marking a significant milestone in artificial intelligence research.",
         "key_points": [
@@ -80,7 +117,7 @@ SAMPLE_ARTICLES = [
         "source": {"name": "Financial Times"},
         "publishedAt": "2024-01-15T09:15:00Z",
         "url": "https://example.com/markets-rally",
-        "urlToImage": "https://via.placeholder.com/400x200?text=Markets+Rally",
+        "urlToImage": placeholder_image("Markets Rally"),
         "category": "Business",
         "ai_summary": "Global financial markets surged as positive economic data and strong corporate earnings boosted investor confidence across major indices.",
         "key_points": [
@@ -96,7 +133,7 @@ SAMPLE_ARTICLES = [
         "source": {"name": "Science Daily"},
         "publishedAt": "2024-01-15T08:45:00Z",
         "url": "https://example.com/new-species",
-        "urlToImage": "https://via.placeholder.com/400x200?text=New+Species",
+        "urlToImage": placeholder_image("New Species"),
         "category": "Science",
         "ai_summary": "Researchers discovered a new butterfly species in the Amazon rainforest, demonstrating the region's rich biodiversity and the importance of conservation efforts.",
         "key_points": [
@@ -112,7 +149,7 @@ SAMPLE_ARTICLES = [
         "source": {"name": "Space News"},
         "publishedAt": "2024-01-15T07:30:00Z",
         "url": "https://example.com/spacex-launch",
-        "urlToImage": "https://via.placeholder.com/400x200?text=SpaceX+Launch",
+        "urlToImage": placeholder_image("SpaceX Launch"),
         "category": "Technology",
         "ai_summary": "SpaceX successfully launched additional Starlink satellites, expanding the constellation and advancing global internet connectivity goals.",
         "key_points": [
@@ -128,7 +165,7 @@ SAMPLE_ARTICLES = [
         "source": {"name": "Global News"},
         "publishedAt": "2024-01-15T06:20:00Z",
         "url": "https://example.com/climate-summit",
-        "urlToImage": "https://via.placeholder.com/400x200?text=Climate+Summit",
+        "urlToImage": placeholder_image("Climate Summit"),
         "category": "Politics",
         "ai_summary": "International climate summit resulted in a historic agreement with ambitious carbon reduction targets and significant renewable energy investment commitments.",
         "key_points": [
@@ -140,6 +177,22 @@ SAMPLE_ARTICLES = [
     }
 ]
 
+# Parse timestamps and group sample articles by category once at import, in first-seen order
+_index = defaultdict(list)
+for _idx, _article in enumerate(SAMPLE_ARTICLES):
+    _article['_idx'] = _idx
+    _article['_published_dt'] = datetime.fromisoformat(_article['publishedAt'].replace('Z', '+00:00'))
+    _article['_published_fmt'] = _article['_published_dt'].strftime('%b %d, %Y %H:%M')
+    _index[_article['category']].append(_article)
+CATEGORIES_INDEX = dict(_index)
+del _index, _idx, _article
+
+# Columnar copy of the sample data for metrics and the table view
+SAMPLE_DF = pd.DataFrame(SAMPLE_ARTICLES).assign(
+    source_name=lambda df: df['source'].str.get('name'),
+    category=lambda df: df['category'].astype('category')
+)
+
 def main():
     # Header
     st.markdown('<h1 class="main-header">📰 News Digest Demo</h1>', unsafe_allow_html=True)
@@ -173,154 +226,160 @@ def main():
         st.markdown('<div class="demo-card"><h3>📊 Demo Stats</h3></div>', unsafe_allow_html=True)
         col1, col2 = st.columns(2)
         with col1:
-            st.metric("Articles", len(SAMPLE_ARTICLES))
-            st.metric("Categories", len(set(article['category'] for article in SAMPLE_ARTICLES)))
+            st.metric("Articles", len(SAMPLE_DF))
+            st.metric("Categories", SAMPLE_DF['category'].nunique())
         with col2:
             st.metric("Avg Rating", "4.2")
             st.metric("Saved", "12")
     
     # Main content
-    # Dashboard metrics
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-        st.metric("Total Articles", len(SAMPLE_ARTICLES))
-        st.markdown('</div>', unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-        st.metric("Categories", len(set(article['category'] for article in SAMPLE_ARTICLES)))
-        st.markdown('</div>', unsafe_allow_html=True)
-    
-    with col3:
-        st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-        st.metric("Avg Rating", "4.2/5")
-        st.markdown('</div>', unsafe_allow_html=True)
-    
-    with col4:
-        st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-        st.metric("Last Updated", datetime.now().strftime("%H:%M"))
-        st.markdown('</div>', unsafe_allow_html=True)
+    # Dashboard metrics, rendered as one grid element
+    metrics = (
+        ("Total Articles", len(SAMPLE_DF)),
+        ("Categories", SAMPLE_DF['category'].nunique()),
+        ("Avg Rating", "4.2/5"),
+        ("Last Updated", datetime.now().strftime("%H:%M"))
+    )
+    st.html(
+        '<div class="metric-grid">'
+        + ''.join(f'<div class="metric-card"><p>{label}</p><h2>{value}</h2></div>' for label, value in metrics)
+        + '</div>'
+    )
     
     # News feed
     st.header("📰 Sample News Feed")
     
-    # Filter articles by selected categories
-    filtered_articles = [article for article in SAMPLE_ARTICLES if article['category'] in selected_categories]
-    
-    # Group by category
-    categorized_articles = {}
-    for article in filtered_articles:
-        category = article['category']
-        if category not in categorized_articles:
-            categorized_articles[category] = []
-        categorized_articles[category].append(article)
+    # Filter the prebuilt category groups by the selection
+    selected = frozenset(selected_categories)
+    categorized_articles = {
+        category: articles for category, articles in CATEGORIES_INDEX.items()
+        if category in selected
+    }
     
-    # Display articles
-    for category, articles in categorized_articles.items():
-        st.markdown(f'<div class="demo-card"><h3>📂 {category} ({len(articles)} articles)</h3></div>', unsafe_allow_html=True)
-        
-        for article in articles:
-            display_demo_article(article)
+    # The table renders the whole feed as one virtualized element
+    layout = st.radio("Feed layout", ['Cards', 'Table'], horizontal=True)
     
-    # Features showcase
-    st.header("🚀 Application Features")
+    if layout == 'Table':
+        display_demo_table(selected)
+    else:
+        display_demo_cards(categorized_articles)
     
-    col1, col2 = st.columns(2)
+    # Static features and setup sections, emitted as one element
+    st.html(STATIC_FOOTER_HTML)
+
+def display_demo_cards(categorized_articles):
+    """Display the feed as article cards with an action row per visible card"""
+    # Only the first feed_limit cards are rendered; "Load more" raises the limit
+    feed_limit = st.session_state.setdefault('feed_limit', PAGE_SIZE)
+    visible_articles = {}
+    remaining = feed_limit
+    for category, articles in categorized_articles.items():
+        if remaining <= 0:
+            break
+        visible_articles[category] = articles[:remaining]
+        remaining -= len(visible_articles[category])
+    total_articles = sum(len(articles) for articles in categorized_articles.values())
     
-    with col1:
-        st.subheader("🤖 AI-Powered Features")
-        st.write("• **Smart Summarization**: AI-generated article summaries")
-        st.write("• **Key Points Extraction**: Automatic identification of main points")
-        st.write("• **Reading Time Estimation**: Time estimates for each article")
-        st.write("• **Content Categorization**: Automatic article classification")
+    # Display the visible feed as a single element
+    st.html(''.join(
+        f'<div class="demo-card"><h3>📂 {html.escape(category)} ({len(categorized_articles[category])} articles)</h3></div>'
+        + ''.join(render_article_html(article) for article in articles)
+        for category, articles in visible_articles.items()
+    ))
     
-    with col2:
-        st.subheader("📊 User Features")
-        st.write("• **Personalized Feed**: Articles based on your interests")
-        st.write("• **Save & Rate**: Save articles and rate them")
-        st.write("• **Analytics Dashboard**: Track your reading patterns")
-        st.write("• **Share Functionality**: Share articles with others")
+    if total_articles > feed_limit:
+        st.button(
+            f"⬇️ Load more ({total_articles - feed_limit} remaining)",
+            on_click=lambda: st.session_state.update(feed_limit=feed_limit + PAGE_SIZE)
+        )
     
-    # Setup instructions
-    st.header("🔧 Get Started")
+    # Interactive controls follow the feed, one compact row per visible article
+    if visible_articles:
+        st.subheader("⚡ Article Actions")
+        for articles in visible_articles.values():
+            for article in articles:
+                display_demo_actions(article, article['_idx'])
+
+def display_demo_table(selected_categories):
+    """Display the feed for a set of categories as a single table"""
+    feed_df = SAMPLE_DF[SAMPLE_DF['category'].isin(selected_categories)]
+    if feed_df.empty:
+        return
     
-    st.info("""
-    **To use the full application with real news:**
+    st.dataframe(
+        feed_df[['urlToImage', 'title', 'source_name', 'category', '_published_fmt', 'reading_time', 'url']],
+        column_config={
+            'urlToImage': st.column_config.ImageColumn(""),
+            'title': st.column_config.TextColumn("Title", width="large"),
+            'source_name': "Source",
+            'category': "Category",
+            '_published_fmt': "Published",
+            'reading_time': st.column_config.NumberColumn("Reading time", format="%d min"),
+            'url': st.column_config.LinkColumn("Open")
+        },
+        hide_index=True,
+        use_container_width=True
+    )
+
+def render_article_html(article):
+    """Build the static HTML for a demo article card"""
+    # Article metadata
+    published_date = html.escape(article['_published_fmt'])
+    source_name = html.escape(article['source']['name'])
+    reading_time = article['reading_time']
     
-    1. **Get API Keys**:
-       - NewsAPI: https://newsapi.org/
-       - Gemini API: https://makersuite.google.com/app/apikey
+    # AI Summary
+    summary_html = ''
+    if article.get('ai_summary'):
+        summary_html = f'<div class="summary-box"><strong>🤖 AI Summary:</strong><br>{html.escape(article["ai_summary"])}</div>'
     
-    2. **Set up the application**:
-       ```bash
-       python deploy.py setup
-       # Edit .env file with your API keys
-       python deploy.py test
-       python deploy.py start
-       ```
+    # Key points
+    points_html = ''
+    if article.get('key_points'):
+        items = ''.join(f'<li>{html.escape(point)}</li>' for point in article['key_points'])
+        points_html = f'<h4>🔑 Key Points:</h4><ul>{items}</ul>'
     
-    3. **Deploy to production**:
-       - Streamlit Cloud: share.streamlit.io
-       - Netlify: netlify.com
-       - Google Colab: Use the provided notebook
-    """)
+    # The image is an inline data URI, so the browser makes no image request
+    return (
+        f'<div class="article-card"><div class="article-body"><h3>{html.escape(article["title"])}</h3>'
+        f'<p class="article-meta">📅 {published_date} | 📰 {source_name} | ⏱️ {reading_time} min read</p>'
+        f'<p>{html.escape(article["description"])}</p>{summary_html}{points_html}</div>'
+        f'<img src="{article["urlToImage"]}" width="150"></div>'
+    )
 
-def display_demo_article(article):
-    """Display a demo article card"""
-    st.markdown('<div class="article-card">', unsafe_allow_html=True)
-    
-    col1, col2 = st.columns([3, 1])
-    
-    with col1:
-        st.subheader(article['title'])
+@st.fragment
+def display_demo_actions(article, idx):
+    """Display a demo article's action row; its actions rerun only this row"""
+    # Demo actions share one form, so picking a rating doesn't rerun the script
+    with st.form(key=f"actions_{idx}"):
+        col_title, col_action1, col_action2, col_action3, col_action4, col_action5 = st.columns([3, 1, 1, 1, 1, 1])
         
-        # Article metadata
-        published_date = article['publishedAt']
-        source_name = article['source']['name']
-        reading_time = article['reading_time']
-        
-        st.caption(f"📅 {published_date} | 📰 {source_name} | ⏱️ {reading_time} min read")
-        
-        # Article description
-        st.write(article['description'])
-        
-        # AI Summary
-        if article.get('ai_summary'):
-            st.markdown(f'<div style="background-color: #e8f4fd; padding: 1rem; border-radius: 8px; border-left: 4px solid #1f77b4; margin: 1rem 0;"><strong>🤖 AI Summary:</strong><br>{article["ai_summary"]}</div>', unsafe_allow_html=True)
-        
-        # Key points
-        if article.get('key_points'):
-            st.subheader("🔑 Key Points:")
-            for point in article['key_points']:
-                st.write(f"• {point}")
-        
-        # Demo actions
-        col_action1, col_action2, col_action3, col_action4 = st.columns(4)
+        with col_title:
+            st.markdown(f"**{article['title']}**")
         
         with col_action1:
-            if st.button("💾 Save", key=f"save_{article['url']}"):
-                st.success("Saved! (Demo)")
+            save = st.form_submit_button("💾 Save")
         
         with col_action2:
-            rating = st.selectbox("⭐ Rate", [1, 2, 3, 4, 5], key=f"rate_{article['url']}")
-            if st.button("Submit", key=f"submit_{article['url']}"):
-                st.success(f"Rated {rating} stars! (Demo)")
+            rating = st.selectbox("⭐ Rate", [1, 2, 3, 4, 5], key=f"rate_{idx}", label_visibility="collapsed")
         
         with col_action3:
-            if st.button("📤 Share", key=f"share_{article['url']}"):
-                st.write(f"Share: {article['url']} (Demo)")
+            submit_rating = st.form_submit_button("⭐ Rate")
         
         with col_action4:
-            if st.button("🔗 Open", key=f"open_{article['url']}"):
-                st.markdown(f"[Open Article]({article['url']}) (Demo)")
-    
-    with col2:
-        # Article image
-        st.image(article['urlToImage'], width=150)
-    
-    st.markdown('</div>', unsafe_allow_html=True)
+            share = st.form_submit_button("📤 Share")
+        
+        with col_action5:
+            open_article = st.form_submit_button("🔗 Open")
+        
+        if save:
+            st.success("Saved! (Demo)")
+        if submit_rating:
+            st.success(f"Rated {rating} stars! (Demo)")
+        if share:
+            st.write(f"Share: {article['url']} (Demo)")
+        if open_article:
+            st.markdown(f"[Open Article]({article['url']}) (Demo)")
 
 if __name__ == "__main__":
     main()
@@ -6,10 +6,16 @@ Handles setup, configuration, and deployment tasks
 
 import os
 import sys
+import hashlib
+import importlib.util
 import subprocess
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Records the requirements.txt hash of the last successful dependency check
+DEPENDENCY_SENTINEL = Path('.deploy_ok')
+
 def check_python_version():
     """Check if Python version is compatible"""
     if sys.version_info < (3, 8):
@@ -18,26 +24,47 @@ def check_python_version():
     print(f"✅ Python {sys.version_info.major}.{sys.version_info.minor} detected")
     return True
 
+def is_module_missing(module):
+    """Check whether a module can be located, without importing it"""
+    try:
+        return importlib.util.find_spec(module) is None
+    except ImportError:
+        # Raised when a parent package (e.g. google) is itself missing
+        return True
+
 def check_dependencies():
     """Check if required dependencies are installed"""
-    required_packages = [
-        'streamlit', 'requests', 'google-generativeai', 
-        'python-dotenv', 'pandas', 'plotly'
-    ]
+    # Skip the check if it already passed for the current requirements
+    requirements_hash = None
+    if os.path.exists('requirements.txt'):
+        requirements_hash = hashlib.sha256(Path('requirements.txt').read_bytes()).hexdigest()
+        if DEPENDENCY_SENTINEL.exists() and DEPENDENCY_SENTINEL.read_text() == requirements_hash:
+            print("✅ All required packages are installed (cached)")
+            return True
     
-    missing_packages = []
+    # Distribution name -> importable module name
+    required_packages = {
+        'streamlit': 'streamlit',
+        'requests': 'requests',
+        'google-generativeai': 'google.generativeai',
+        'python-dotenv': 'dotenv',
+        'pandas': 'pandas',
+        'plotly': 'plotly'
+    }
     
-    for package in required_packages:
-        try:
-            __import__(package.replace('-', '_'))
-        except ImportError:
-            missing_packages.append(package)
+    # Probe all packages concurrently; each probe is mostly sys.path stat calls
+    with ThreadPoolExecutor(max_workers=len(required_packages)) as executor:
+        missing = executor.map(is_module_missing, required_packages.values())
+        missing_packages = [package for package, is_missing in zip(required_packages, missing) if is_missing]
     
     if missing_packages:
         print(f"❌ Missing packages: {', '.join(missing_packages)}")
         print("Run: pip install -r requirements.txt")
         return False
     
+    if requirements_hash:
+        DEPENDENCY_SENTINEL.write_text(requirements_hash)
+    
     print("✅ All required packages are installed")
     return True
 
@@ -134,12 +161,21 @@ def start_application():
             print("❌ app.py not found")
             return False
         
-        # Start Streamlit
-        subprocess.run([
-            sys.executable, '-m', 'streamlit', 'run', 'app.py',
-            '--server.port', '8501',
-            '--server.address', 'localhost'
-        ])
+        flag_options = {'server.port': 8501, 'server.address': 'localhost'}
+        
+        try:
+            from streamlit.web import bootstrap
+        except ImportError:
+            # Older Streamlit without the in-process entry point
+            subprocess.run([
+                sys.executable, '-m', 'streamlit', 'run', 'app.py',
+                '--server.port', str(flag_options['server.port']),
+                '--server.address', flag_options['server.address']
+            ])
+        else:
+            # Start Streamlit in this process instead of a second interpreter
+            bootstrap.load_config_options(flag_options=flag_options)
+            bootstrap.run('app.py', False, [], flag_options)
         
     except KeyboardInterrupt:
         print("\n👋 Application stopped by user")
@@ -1,23 +1,34 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 from datetime import datetime, timedelta
+from pathlib import Path
+import asyncio
+import hashlib
 import os
+import threading
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 # Import our utility modules
 from utils import NewsAPIClient, GeminiAPIClient, DataManager
+from utils.news_api import create_http_session
 
 # Load environment variables
 load_dotenv()
 
+@st.cache_resource
+def get_http_session():
+    """Shared pooled, disk-cached HTTP session that retries transient failures"""
+    retries = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+    return create_http_session(max_retries=retries, pool_maxsize=32)
+
 # Initialize clients
 @st.cache_resource
 def init_clients():
     """Initialize API clients with caching"""
     try:
-        news_client = NewsAPIClient()
+        news_client = NewsAPIClient(session=get_http_session())
         gemini_client = GeminiAPIClient()
         data_manager = DataManager()
         return news_client, gemini_client, data_manager
@@ -25,6 +36,122 @@ def init_clients():
         st.error(f"Error initializing clients: {str(e)}")
         return None, None, None
 
+@st.cache_data(ttl=600, max_entries=64, show_spinner=False)
+def fetch_articles_cached(interests, frequency):
+    """Fetch articles for a tuple of interests, memoized for ten minutes"""
+    news_client, _, _ = init_clients()
+    articles = news_client.fetch_articles_by_interests(list(interests), frequency)
+    if not articles:
+        # Raise so an empty or failed fetch is never cached
+        raise RuntimeError("No articles found. Please try different interests or check your API key.")
+    return articles
+
+# User data is re-read from disk at most once per rerun; writes clear these caches
+@st.cache_data(ttl=2, show_spinner=False)
+def load_saved_cached():
+    """Load saved articles, memoized across the calls of one rerun"""
+    _, _, data_manager = init_clients()
+    return data_manager.load_saved_articles()
+
+@st.cache_data(ttl=2, show_spinner=False)
+def load_ratings_cached():
+    """Load ratings, memoized across the calls of one rerun"""
+    _, _, data_manager = init_clients()
+    return data_manager.load_ratings()
+
+@st.cache_data(ttl=2, show_spinner=False)
+def user_stats_cached():
+    """Compute user stats, memoized across the calls of one rerun"""
+    _, _, data_manager = init_clients()
+    return data_manager.get_user_stats()
+
+@st.cache_data(ttl=2, show_spinner=False)
+def data_size_cached():
+    """Measure the data files, memoized across the calls of one rerun"""
+    _, _, data_manager = init_clients()
+    return data_manager.get_data_size()
+
+def clear_data_caches():
+    """Drop memoized user data after a write"""
+    load_saved_cached.clear()
+    load_ratings_cached.clear()
+    user_stats_cached.clear()
+    data_size_cached.clear()
+
+@st.cache_data(persist="disk", max_entries=5000, show_spinner=False)
+def enrich_article_cached(url, title, content):
+    """Summarize an article once per URL and content, persisted to disk across restarts"""
+    _, gemini_client, _ = init_clients()
+    enriched = gemini_client.enrich_article({'url': url, 'title': title, 'content': content})
+    if enriched['ai_summary'].startswith("Summary unavailable"):
+        # Raise so failed summaries are never cached
+        raise RuntimeError(enriched['ai_summary'])
+    return {key: enriched[key] for key in ('ai_summary', 'key_points', 'reading_time')}
+
+def cached_enricher():
+    """Build an enrich callback for worker threads that goes through enrich_article_cached"""
+    ctx = get_script_run_ctx()
+    
+    def enrich(article):
+        # Worker threads need the script context to reach Streamlit's cache
+        add_script_run_ctx(threading.current_thread(), ctx)
+        try:
+            article.update(enrich_article_cached(article.get('url', ''), article.get('title', ''), article.get('content', '')))
+        except Exception as e:
+            article.update(ai_summary=str(e), key_points=["Key points unavailable"], reading_time=2)
+        return article
+    
+    return enrich
+
+@st.cache_data(show_spinner=False)
+def category_pie(categories):
+    """Build the category pie chart for a tuple of article categories"""
+    # Plotly is imported on first use so only the Analytics view pays for it
+    import plotly.express as px
+    
+    counts = pd.Series(categories).value_counts()
+    return px.pie(values=counts.values, names=counts.index, title="Articles by Category")
+
+@st.cache_data(show_spinner=False)
+def rating_bar(ratings):
+    """Build the rating distribution bar chart for a tuple of ratings"""
+    import plotly.express as px
+    
+    counts = pd.Series(ratings).value_counts().sort_index()
+    return px.bar(
+        x=counts.index,
+        y=counts.values,
+        title="Rating Distribution",
+        labels={'x': 'Rating', 'y': 'Count'}
+    )
+
+@st.cache_data(ttl=60, show_spinner=False)
+def api_status(_news_client, _gemini_client):
+    """Return (news_ok, gemini_ok, gemini_model_available), probing Gemini at most once a minute"""
+    gemini_model_available = bool(_gemini_client) and _gemini_client.get_model_info().get('model_available', False)
+    return bool(_news_client), bool(_gemini_client), gemini_model_available
+
+@st.cache_data(show_spinner=False)
+def saved_articles_frame(saved_fingerprint, _saved_articles):
+    """Filter/sort columns of the saved articles; cached on their (url, saved_at) pairs"""
+    return pd.DataFrame({
+        'title': [article.get('title', '') for article in _saved_articles],
+        'category': [article.get('category', 'Unknown') for article in _saved_articles],
+        'saved_at': [article.get('saved_at', '') for article in _saved_articles],
+    })
+
+SAVED_SORT_COLUMNS = {'Date Saved': 'saved_at', 'Title': 'title', 'Category': 'category'}
+
+# Display-only fields added to fetched articles; they are left out of saved copies
+DISPLAY_FIELDS = frozenset({'_key', 'short_desc', 'top_points'})
+
+@st.cache_data(show_spinner=False)
+def group_by_category(news_fingerprint, _articles):
+    """Group article positions by category; cached on the tuple of article URLs"""
+    categories = pd.Series([article.get('category') for article in _articles], dtype=object).fillna('General')
+    groups = {category: list(positions) for category, positions in categories.groupby(categories, sort=False).indices.items()}
+    return groups, len(groups)
+
 # Page configuration
 st.set_page_config(
     page_title="News Digest Dashboard",
@@ -33,129 +160,14 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS for enhanced styling
-st.markdown("""
-<style>
-    /* Global text color fix */
-    .stApp {
-        color: #2c3e50;
-    }
-    
-    /* Main header with better contrast */
-    .main-header {
-        font-size: 3rem;
-        font-weight: bold;
-        background: linear-gradient(135deg, #2c3e50 0%, #34495e 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        text-align: center;
-        margin-bottom: 2rem;
-    }
-    
-    /* Category cards with dark text on light background */
-    .category-card {
-        background: linear-gradient(135deg, #ecf0f1 0%, #bdc3c7 100%);
-        color: #2c3e50;
-        padding: 1rem;
-        border-radius: 15px;
-        margin: 0.5rem 0;
-        box-shadow: 0 4px 15px rgba(0,0,0,0.1);
-        border: 1px solid #bdc3c7;
-    }
-    
-    /* Article cards with proper contrast */
-    .article-card {
-        background: #ffffff;
-        color: #2c3e50;
-        padding: 1.5rem;
-        border-radius: 15px;
-        margin: 1rem 0;
-        box-shadow: 0 4px 15px rgba(0,0,0,0.1);
-        border: 1px solid #e0e0e0;
-        transition: transform 0.2s;
-    }
-    .article-card:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 6px 20px rgba(0,0,0,0.15);
-    }
-    
-    /* Summary box with dark text */
-    .summary-box {
-        background: linear-gradient(135deg, #e8f4f8 0%, #f0f8ff 100%);
-        color: #2c3e50;
-        padding: 1rem;
-        border-radius: 10px;
-        margin: 1rem 0;
-        border-left: 4px solid #3498db;
-    }
-    
-    /* Metric cards with white text on dark background */
-    .metric-card {
-        background: linear-gradient(135deg, #3498db 0%, #2980b9 100%);
-        color: white;
-        padding: 1.5rem;
-        border-radius: 15px;
-        text-align: center;
-        box-shadow: 0 4px 15px rgba(0,0,0,0.1);
-    }
-    
-    /* Buttons with better styling */
-    .stButton > button {
-        background: linear-gradient(135deg, #3498db 0%, #2980b9 100%);
-        color: white;
-        border-radius: 25px;
-        padding: 0.5rem 2rem;
-        border: none;
-        box-shadow: 0 4px 15px rgba(0,0,0,0.1);
-        transition: all 0.3s;
-        font-weight: 600;
-    }
-    .stButton > button:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 6px 20px rgba(0,0,0,0.15);
-        background: linear-gradient(135deg, #2980b9 0%, #1f5f8b 100%);
-    }
-    
-    /* Sidebar headers */
-    .sidebar-header {
-        background: linear-gradient(135deg, #34495e 0%, #2c3e50 100%);
-        color: white;
-        padding: 1rem;
-        border-radius: 10px;
-        margin-bottom: 1rem;
-    }
-    
-    /* Stats container with better contrast */
-    .stats-container {
-        background: rgba(52, 73, 94, 0.1);
-        color: #2c3e50;
-        padding: 1rem;
-        border-radius: 10px;
-        margin: 0.5rem 0;
-        border: 1px solid #bdc3c7;
-    }
-    
-    /* Fix for Streamlit text elements */
-    .stMarkdown, .stText {
-        color: #2c3e50 !important;
-    }
-    
-    /* Fix for sidebar text */
-    .css-1d391kg {
-        color: #2c3e50 !important;
-    }
-    
-    /* Better contrast for selectboxes and inputs */
-    .stSelectbox > div > div {
-        color: #2c3e50 !important;
-    }
-    
-    /* Fix for multiselect */
-    .stMultiSelect > div > div {
-        color: #2c3e50 !important;
-    }
-</style>
-""", unsafe_allow_html=True)
+# Custom CSS for enhanced styling, shared with app_enhanced
+@st.cache_resource
+def _css():
+    """Read the stylesheet once per process"""
+    return (Path(__file__).parent / 'assets' / 'enhanced.css').read_text()
+
+# Emitted on every rerun; elements a rerun skips are removed from the page
+st.html(f"<style>{_css()}</style>")
 
 def main():
     # Initialize clients
@@ -171,6 +183,7 @@ def main():
     # Initialize session state
     if 'current_view' not in st.session_state:
         st.session_state.current_view = 'Dashboard'
+    st.session_state.clients = (news_client, gemini_client, data_manager)
     
     # Sidebar
     with st.sidebar:
@@ -213,25 +226,29 @@ def show_dashboard_sidebar(news_client, gemini_client, data_manager):
     # Load current preferences
     preferences = data_manager.load_user_preferences()
     
-    # Interest selection
-    st.subheader("📂 Select Interests")
-    available_categories = ['Technology', 'Business', 'Science', 'Politics', 'Sports', 'Entertainment']
-    selected_interests = st.multiselect(
-        "Choose news categories:",
-        available_categories,
-        default=preferences.get('interests', [])
-    )
-    
-    # Frequency selection
-    st.subheader("📅 Update Frequency")
-    frequency = st.selectbox(
-        "How often would you like updates?",
-        ['daily', 'weekly'],
-        index=0 if preferences.get('frequency') == 'daily' else 1
-    )
+    # One form so picking interests and frequency reruns the script once, on submit
+    with st.form('prefs'):
+        # Interest selection
+        st.subheader("📂 Select Interests")
+        available_categories = ['Technology', 'Business', 'Science', 'Politics', 'Sports', 'Entertainment']
+        selected_interests = st.multiselect(
+            "Choose news categories:",
+            available_categories,
+            default=preferences.get('interests', [])
+        )
+        
+        # Frequency selection
+        st.subheader("📅 Update Frequency")
+        frequency = st.selectbox(
+            "How often would you like updates?",
+            ['daily', 'weekly'],
+            index=0 if preferences.get('frequency') == 'daily' else 1
+        )
+        
+        submitted = st.form_submit_button("🔄 Update & Fetch News")
     
     # Update preferences
-    if st.button("🔄 Update & Fetch News"):
+    if submitted:
         with st.spinner("Updating preferences and fetching news..."):
             # Save preferences
             preferences['interests'] = selected_interests
@@ -240,11 +257,43 @@ def show_dashboard_sidebar(news_client, gemini_client, data_manager):
             
             # Fetch news
             if selected_interests:
-                articles = news_client.fetch_articles_by_interests(selected_interests, frequency)
+                try:
+                    articles = fetch_articles_cached(tuple(selected_interests), frequency)
+                except RuntimeError as e:
+                    st.warning(str(e))
+                    articles = []
                 
-                # Enhance articles with AI summaries
+                # Overlapping interests can return the same story twice; summarize it once
+                seen_urls = set()
+                unique_articles = []
+                for article in articles:
+                    url = article.get('url')
+                    if url and url in seen_urls:
+                        continue
+                    seen_urls.add(url)
+                    unique_articles.append(article)
+                articles = unique_articles
+                
+                # Enhance articles with AI summaries, several requests in flight at once
                 if articles:
-                    articles = gemini_client.batch_summarize(articles, delay=0.5)
+                    progress = st.progress(0.0, text="Summarizing articles...")
+                    
+                    def show_progress(article, done, total):
+                        progress.progress(done / total, text=f"Summarized {done}/{total}: {article.get('title', '')[:60]}")
+                    
+                    articles = asyncio.run(gemini_client.async_batch_summarize(
+                        articles, enrich=cached_enricher(), on_complete=show_progress
+                    ))
+                    progress.empty()
+                
+                # Stable widget keys; the position keeps title-only keys apart. blake2b is just a fast identity hash here
+                for idx, article in enumerate(articles):
+                    article['_key'] = hashlib.blake2b(f"{article.get('url') or article.get('title', '')}{idx}".encode(), digest_size=5).hexdigest()
+                    
+                    # Display-ready fields so cards don't slice on every rerun
+                    description = article.get('description') or 'No description available.'
+                    article['short_desc'] = description[:200] + "..." if len(description) > 200 else description
+                    article['top_points'] = (article.get('key_points') or [])[:3]
                 
                 st.session_state.news_data = articles
                 st.success(f"✅ Fetched {len(articles)} articles!")
@@ -255,7 +304,7 @@ def show_dashboard_sidebar(news_client, gemini_client, data_manager):
     st.markdown('<div class="stats-container">', unsafe_allow_html=True)
     st.subheader("📊 Quick Stats")
     
-    user_stats = data_manager.get_user_stats()
+    user_stats = user_stats_cached()
     col1, col2 = st.columns(2)
     
     with col1:
@@ -271,23 +320,27 @@ def show_dashboard_sidebar(news_client, gemini_client, data_manager):
 def show_dashboard(news_client, gemini_client, data_manager):
     """Show main dashboard"""
     
+    # Group the feed once per distinct set of articles
+    news_data = st.session_state.get('news_data', [])
+    news_fingerprint = tuple(article.get('url', '') for article in news_data)
+    categorized_positions, categories_count = group_by_category(news_fingerprint, news_data)
+    
     # Dashboard metrics
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
         st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-        st.metric("Total Articles", len(st.session_state.get('news_data', [])))
+        st.metric("Total Articles", len(news_data))
         st.markdown('</div>', unsafe_allow_html=True)
     
     with col2:
         st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-        categories_count = len(set(article.get('category', 'Unknown') for article in st.session_state.get('news_data', [])))
         st.metric("Categories", categories_count)
         st.markdown('</div>', unsafe_allow_html=True)
     
     with col3:
         st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-        user_stats = data_manager.get_user_stats()
+        user_stats = user_stats_cached()
         st.metric("Avg Rating", f"{user_stats.get('average_rating', 0):.1f}/5")
         st.markdown('</div>', unsafe_allow_html=True)
     
@@ -297,19 +350,12 @@ def show_dashboard(news_client, gemini_client, data_manager):
         st.markdown('</div>', unsafe_allow_html=True)
     
     # News feed
-    if st.session_state.get('news_data'):
+    if news_data:
         st.header("📰 Your Personalized News Feed")
         
-        # Categorize articles
-        categorized_articles = {}
-        for article in st.session_state.news_data:
-            category = article.get('category', 'General')
-            if category not in categorized_articles:
-                categorized_articles[category] = []
-            categorized_articles[category].append(article)
-        
         # Display articles by category
-        for category, articles in categorized_articles.items():
+        for category, positions in categorized_positions.items():
+            articles = [news_data[i] for i in positions]
             st.markdown(f'<div class="category-card"><h3>📂 {category} ({len(articles)} articles)</h3></div>', unsafe_allow_html=True)
             
             for article in articles:
@@ -317,146 +363,148 @@ def show_dashboard(news_client, gemini_client, data_manager):
     else:
         st.info("👆 Select your interests and update preferences to see your personalized news feed!")
 
+@st.fragment
 def display_enhanced_article_card(article, data_manager):
-    """Display an enhanced article card with more features"""
-    # Create unique key using article title, URL, and current timestamp
-    import hashlib
-    import time
-    unique_string = f"{article.get('title', '')}{article.get('url', '')}{time.time()}"
-    article_key = hashlib.md5(unique_string.encode()).hexdigest()[:8]
-    
-    st.markdown('<div class="article-card">', unsafe_allow_html=True)
-    
-    col1, col2 = st.columns([3, 1])
-    
-    with col1:
-        st.subheader(article.get('title', 'No title'))
-        
-        # Article metadata
-        published_date = article.get('publishedAt', 'Unknown date')
-        source_name = article.get('source', {}).get('name', 'Unknown source')
-        reading_time = article.get('reading_time', 2)
-        
-        st.caption(f"📅 {published_date} | 📰 {source_name} | ⏱️ {reading_time} min read")
+    """Display an enhanced article card; its actions rerun only this card"""
+    # Unique key precomputed when the articles were fetched
+    article_key = article['_key']
+    
+    # Read each field once per render
+    url = article.get('url', '')
+    title = article.get('title', 'No title')
+    short_desc = article['short_desc']
+    image_url = article.get('urlToImage')
+    ai_summary = article.get('ai_summary')
+    top_points = article['top_points']
+    published_date = article.get('publishedAt', 'Unknown date')
+    source_name = article.get('source', {}).get('name', 'Unknown source')
+    reading_time = article.get('reading_time', 2)
+    
+    with st.container(border=True):
+        col1, col2 = st.columns([3, 1])
         
-        # Article description
-        description = article.get('description', 'No description available.')
-        st.write(description[:200] + "..." if len(description) > 200 else description)
-        
-        # AI Summary (if available)
-        if article.get('ai_summary'):
-            st.markdown(f'<div class="summary-box"><strong>🤖 AI Summary:</strong><br>{article.get("ai_summary")}</div>', unsafe_allow_html=True)
-        
-        # Key points (if available)
-        if article.get('key_points'):
-            st.subheader("🔑 Key Points:")
-            for point in article.get('key_points', [])[:3]:
-                st.write(f"• {point}")
-        
-        # Article actions
-        col_action1, col_action2, col_action3, col_action4 = st.columns(4)
-        
-        with col_action1:
-            if st.button("💾 Save", key=f"save_{article_key}"):
-                if data_manager.save_article(article):
-                    st.success("Saved!")
-                else:
-                    st.info("Already saved!")
-        
-        with col_action2:
-            rating = st.selectbox("⭐ Rate", [1, 2, 3, 4, 5], key=f"rate_{article_key}")
-            if st.button("Submit", key=f"submit_rate_{article_key}"):
-                data_manager.save_rating(article.get('url', ''), rating)
-                st.success(f"Rated {rating} stars!")
-        
-        with col_action3:
-            if st.button("📤 Share", key=f"share_{article_key}"):
-                st.write(f"Share this article: {article.get('url', '')}")
+        with col1:
+            st.subheader(title)
+            
+            # Article metadata
+            st.caption(f"📅 {published_date} | 📰 {source_name} | ⏱️ {reading_time} min read")
+            
+            # Article description
+            st.write(short_desc)
+            
+            # AI Summary (if available)
+            if ai_summary:
+                st.markdown(f'<div class="summary-box"><strong>🤖 AI Summary:</strong><br>{ai_summary}</div>', unsafe_allow_html=True)
+            
+            # Key points (if available)
+            if top_points:
+                st.subheader("🔑 Key Points:")
+                for point in top_points:
+                    st.write(f"• {point}")
+            
+            # Article actions
+            col_action1, col_action2, col_action3, col_action4 = st.columns(4)
+            
+            with col_action1:
+                if st.button("💾 Save", key=f"save_{article_key}"):
+                    # Save a detached copy so UI fields and later edits don't reach the saved record
+                    if data_manager.save_article({k: v for k, v in article.items() if k not in DISPLAY_FIELDS}):
+                        clear_data_caches()
+                        st.success("Saved!")
+                    else:
+                        st.info("Already saved!")
+            
+            with col_action2:
+                rating = st.selectbox("⭐ Rate", [1, 2, 3, 4, 5], key=f"rate_{article_key}")
+                if st.button("Submit", key=f"submit_rate_{article_key}"):
+                    data_manager.save_rating(url, rating)
+                    clear_data_caches()
+                    st.success(f"Rated {rating} stars!")
+            
+            with col_action3:
+                if st.button("📤 Share", key=f"share_{article_key}"):
+                    st.write(f"Share this article: {url}")
+            
+            with col_action4:
+                if st.button("🔗 Open", key=f"open_{article_key}"):
+                    st.markdown(f"[Open Article]({url})")
         
-        with col_action4:
-            if st.button("🔗 Open", key=f"open_{article_key}"):
-                st.markdown(f"[Open Article]({article.get('url', '')})")
-    
-    with col2:
-        # Article image
-        if article.get('urlToImage'):
-            st.image(article.get('urlToImage'), width=150)
-        else:
-            st.image("https://via.placeholder.com/150x100?text=No+Image", width=150)
-    
-    st.markdown('</div>', unsafe_allow_html=True)
+        with col2:
+            # Article image
+            if image_url:
+                st.image(image_url, width=150)
+            else:
+                st.image("https://via.placeholder.com/150x100?text=No+Image", width=150)
 
 def show_saved_sidebar(data_manager):
     """Show saved articles sidebar"""
     st.markdown('<div class="sidebar-header"><h3>📚 Saved Articles</h3></div>', unsafe_allow_html=True)
     
-    saved_articles = data_manager.load_saved_articles()
+    saved_articles = load_saved_cached()
     st.metric("Total Saved", len(saved_articles))
     
     if st.button("🗑️ Clear All Saved"):
         if st.button("Confirm Clear"):
             data_manager.clear_all_data()
+            clear_data_caches()
             st.success("All saved articles cleared!")
 
 def show_saved_articles(data_manager):
     """Show saved articles view"""
     st.header("📚 Your Saved Articles")
     
-    saved_articles = data_manager.load_saved_articles()
+    saved_articles = load_saved_cached()
     
     if not saved_articles:
         st.info("No saved articles yet. Start reading and save interesting articles!")
         return
     
+    saved_fingerprint = tuple((article.get('url', ''), article.get('saved_at', '')) for article in saved_articles)
+    df = saved_articles_frame(saved_fingerprint, saved_articles)
+    
     # Filter options
     col1, col2 = st.columns(2)
     with col1:
-        categories = list(set(article.get('category', 'Unknown') for article in saved_articles))
+        categories = list(df['category'].unique())
         selected_category = st.selectbox("Filter by Category", ['All'] + categories)
     
     with col2:
-        sort_by = st.selectbox("Sort by", ['Date Saved', 'Title', 'Category'])
+        sort_by = st.selectbox("Sort by", list(SAVED_SORT_COLUMNS))
     
-    # Filter and sort articles
-    filtered_articles = saved_articles
+    # Filter and sort articles; rows keep their position in saved_articles
     if selected_category != 'All':
-        filtered_articles = [a for a in saved_articles if a.get('category') == selected_category]
-    
-    # Sort articles
-    if sort_by == 'Date Saved':
-        filtered_articles.sort(key=lambda x: x.get('saved_at', ''), reverse=True)
-    elif sort_by == 'Title':
-        filtered_articles.sort(key=lambda x: x.get('title', ''))
-    elif sort_by == 'Category':
-        filtered_articles.sort(key=lambda x: x.get('category', ''))
+        df = df[df['category'] == selected_category]
+    df = df.sort_values(SAVED_SORT_COLUMNS[sort_by], ascending=(sort_by != 'Date Saved'), kind='stable')
     
     # Display articles
-    for i, article in enumerate(filtered_articles):
-        st.markdown('<div class="article-card">', unsafe_allow_html=True)
-        
-        col1, col2 = st.columns([4, 1])
+    for i in df.index:
+        article = saved_articles[i]
+        image_url = article.get('urlToImage')
+        source_name = article.get('source', {}).get('name', 'Unknown source')
         
-        with col1:
-            st.subheader(article.get('title', 'No title'))
-            st.caption(f"📅 {article.get('publishedAt', 'Unknown date')} | 📰 {article.get('source', {}).get('name', 'Unknown source')}")
-            st.write(article.get('description', 'No description available.'))
+        with st.container(border=True):
+            col1, col2 = st.columns([4, 1])
             
-            if st.button(f"🗑️ Remove", key=f"remove_{i}"):
-                data_manager.remove_saved_article(article.get('url', ''))
-                st.success("Article removed!")
-                st.rerun()
-        
-        with col2:
-            if article.get('urlToImage'):
-                st.image(article.get('urlToImage'), width=100)
-        
-        st.markdown('</div>', unsafe_allow_html=True)
+            with col1:
+                st.subheader(article.get('title', 'No title'))
+                st.caption(f"📅 {article.get('publishedAt', 'Unknown date')} | 📰 {source_name}")
+                st.write(article.get('description', 'No description available.'))
+                
+                if st.button(f"🗑️ Remove", key=f"remove_{i}"):
+                    data_manager.remove_saved_article(article.get('url', ''))
+                    clear_data_caches()
+                    st.success("Article removed!")
+                    st.rerun()
+            
+            with col2:
+                if image_url:
+                    st.image(image_url, width=100)
 
 def show_analytics_sidebar(data_manager):
     """Show analytics sidebar"""
     st.markdown('<div class="sidebar-header"><h3>📊 Analytics</h3></div>', unsafe_allow_html=True)
     
-    user_stats = data_manager.get_user_stats()
+    user_stats = user_stats_cached()
     st.metric("Total Articles", user_stats.get('total_saved_articles', 0))
     st.metric("Average Rating", f"{user_stats.get('average_rating', 0):.1f}")
 
@@ -464,9 +512,9 @@ def show_analytics(data_manager):
     """Show analytics view"""
     st.header("📊 Your Reading Analytics")
     
-    user_stats = data_manager.get_user_stats()
-    saved_articles = data_manager.load_saved_articles()
-    ratings = data_manager.load_ratings()
+    user_stats = user_stats_cached()
+    saved_articles = load_saved_cached()
+    ratings = load_ratings_cached()
     
     # Overview metrics
     col1, col2, col3, col4 = st.columns(4)
@@ -496,42 +544,21 @@ def show_analytics(data_manager):
         col1, col2 = st.columns(2)
         
         with col1:
-            # Category distribution
-            category_counts = {}
-            for article in saved_articles:
-                category = article.get('category', 'Unknown')
-                category_counts[category] = category_counts.get(category, 0) + 1
-            
-            if category_counts:
-                fig = px.pie(
-                    values=list(category_counts.values()),
-                    names=list(category_counts.keys()),
-                    title="Articles by Category"
-                )
-                st.plotly_chart(fig, use_container_width=True)
+            # Category distribution; the figure is cached on the category tuple
+            fig = category_pie(tuple(article.get('category', 'Unknown') for article in saved_articles))
+            st.plotly_chart(fig, use_container_width=True)
         
         with col2:
             # Rating distribution
             if ratings:
-                rating_counts = {}
-                for rating_data in ratings.values():
-                    rating = rating_data.get('rating', 0)
-                    rating_counts[rating] = rating_counts.get(rating, 0) + 1
-                
-                if rating_counts:
-                    fig = px.bar(
-                        x=list(rating_counts.keys()),
-                        y=list(rating_counts.values()),
-                        title="Rating Distribution",
-                        labels={'x': 'Rating', 'y': 'Count'}
-                    )
-                    st.plotly_chart(fig, use_container_width=True)
+                fig = rating_bar(tuple(rating_data.get('rating', 0) for rating_data in ratings.values()))
+                st.plotly_chart(fig, use_container_width=True)
 
 def show_settings_sidebar(data_manager):
     """Show settings sidebar"""
     st.markdown('<div class="sidebar-header"><h3>⚙️ Settings</h3></div>', unsafe_allow_html=True)
     
-    data_sizes = data_manager.get_data_size()
+    data_sizes = data_size_cached()
     total_size = sum(data_sizes.values())
     st.metric("Data Size", f"{total_size / 1024:.1f} KB")
 
@@ -556,13 +583,14 @@ def show_settings(data_manager):
         if st.button("🗑️ Clear All Data"):
             if st.button("⚠️ Confirm Clear All"):
                 if data_manager.clear_all_data():
+                    clear_data_caches()
                     st.success("All data cleared!")
                 else:
                     st.error("Failed to clear data")
     
     # Data statistics
     st.subheader("📊 Data Statistics")
-    data_sizes = data_manager.get_data_size()
+    data_sizes = data_size_cached()
     
     for name, size in data_sizes.items():
         st.metric(f"{name.title()} Size", f"{size / 1024:.1f} KB")
@@ -571,20 +599,20 @@ def show_settings(data_manager):
     st.subheader("🔗 API Status")
     
     try:
-        news_client, gemini_client, _ = init_clients()
+        news_client, gemini_client, _ = st.session_state.clients
+        news_ok, gemini_ok, gemini_model_available = api_status(news_client, gemini_client)
         
         col1, col2 = st.columns(2)
         
         with col1:
-            if news_client:
+            if news_ok:
                 st.success("✅ NewsAPI: Connected")
             else:
                 st.error("❌ NewsAPI: Not connected")
         
         with col2:
-            if gemini_client:
-                model_info = gemini_client.get_model_info()
-                if model_info.get('model_available'):
+            if gemini_ok:
+                if gemini_model_available:
                     st.success("✅ Gemini API: Connected")
                 else:
                     st.error("❌ Gemini API: Not available")
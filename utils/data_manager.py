@@ -1,11 +1,38 @@
-import json
+import atexit
 import os
+import threading
+from collections import Counter, deque
 from datetime import datetime
+from statistics import fmean
+import ijson
+import orjson
 from typing import Dict, List, Optional
 import pandas as pd
 
+# 128 KiB buffers batch log lines and large files into fewer syscalls
+FILE_BUFFER_SIZE = 1 << 17
+
+# Only the most recent analytics entries are kept
+ANALYTICS_LIMIT = 100
+
+DEFAULT_PREFERENCES = {
+    'interests': [],
+    'frequency': 'daily',
+    'notifications': True,
+    'theme': 'light',
+    'last_updated': None
+}
+
+# JSON arrays above this size are streamed record by record instead of read whole
+STREAMING_THRESHOLD = 8 * 1024 * 1024
+
 class DataManager:
-    """Manages user data, preferences, and article storage"""
+    """Manages user data, preferences, and article storage
+    
+    Parsed files are kept in memory and mutations write back only the files
+    they touched. Use the manager as a context manager to batch several
+    mutations into a single write per file.
+    """
     
     def __init__(self, data_dir: str = "./data"):
         self.data_dir = data_dir
@@ -13,10 +40,155 @@ class DataManager:
         
         # File paths
         self.preferences_file = os.path.join(data_dir, "user_preferences.json")
-        self.saved_articles_file = os.path.join(data_dir, "saved_articles.json")
+        self.saved_articles_file = os.path.join(data_dir, "saved_articles.jsonl")
+        self.legacy_saved_articles_file = os.path.join(data_dir, "saved_articles.json")
         self.ratings_file = os.path.join(data_dir, "ratings.json")
         self.analytics_file = os.path.join(data_dir, "analytics.json")
         
+        # In-memory copies of the files, and the names that still need writing.
+        # Saved articles are an append-only log and are written separately
+        self._paths = {
+            'preferences': self.preferences_file,
+            'ratings': self.ratings_file,
+            'analytics': self.analytics_file
+        }
+        self._cache = {}
+        self._dirty = set()
+        self._batch_depth = 0
+        self._stale_lines = 0
+        self._saved_urls = set()
+        self._lock = threading.RLock()
+        atexit.register(self.flush)
+    
+    def __enter__(self):
+        """Start a batch; dirty files are written once when the outermost batch ends"""
+        self._lock.acquire()
+        self._batch_depth += 1
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.flush()
+        finally:
+            self._lock.release()
+        return False
+    
+    def _load(self, name: str, default):
+        """Return the cached contents of a data file, reading it on first use"""
+        with self._lock:
+            if name not in self._cache:
+                path = self._paths[name]
+                if os.path.exists(path):
+                    with open(path, 'rb', buffering=FILE_BUFFER_SIZE) as f:
+                        self._cache[name] = orjson.loads(f.read())
+                else:
+                    self._cache[name] = default
+            return self._cache[name]
+    
+    def _store(self, name: str, data):
+        """Replace the cached contents of a data file and mark it for writing"""
+        self._cache[name] = data
+        self._dirty.add(name)
+    
+    def _load_analytics(self) -> deque:
+        """Return the cached analytics as a ring buffer of the newest entries"""
+        with self._lock:
+            analytics = self._load('analytics', [])
+            if not isinstance(analytics, deque):
+                analytics = self._cache['analytics'] = deque(analytics, maxlen=ANALYTICS_LIMIT)
+            return analytics
+    
+    def _load_saved(self) -> List[Dict]:
+        """Replay the saved-articles log into the cache, reading it on first use"""
+        with self._lock:
+            if 'saved_articles' not in self._cache:
+                articles = {}
+                line_count = 0
+                torn = False
+                if os.path.exists(self.saved_articles_file):
+                    with open(self.saved_articles_file, 'rb', buffering=FILE_BUFFER_SIZE) as f:
+                        for line in f:
+                            if not line.strip():
+                                continue
+                            line_count += 1
+                            try:
+                                record = orjson.loads(line)
+                            except orjson.JSONDecodeError:
+                                # A write torn by a crash loses only its own line
+                                torn = True
+                                continue
+                            # Tombstones drop the article; later lines replace earlier versions
+                            if '_deleted' in record:
+                                articles.pop(record['_deleted'], None)
+                            else:
+                                articles[record.get('url', '')] = record
+                    self._cache['saved_articles'] = list(articles.values())
+                    self._stale_lines = line_count - len(articles)
+                    if torn:
+                        # Rewrite the log so later appends don't land on the torn line
+                        self._compact_saved()
+                elif os.path.exists(self.legacy_saved_articles_file):
+                    # Migrate the old JSON array into the log once
+                    with open(self.legacy_saved_articles_file, 'rb', buffering=FILE_BUFFER_SIZE) as f:
+                        if os.path.getsize(self.legacy_saved_articles_file) > STREAMING_THRESHOLD:
+                            self._cache['saved_articles'] = list(ijson.items(f, 'item', use_float=True))
+                        else:
+                            self._cache['saved_articles'] = orjson.loads(f.read())
+                    self._compact_saved()
+                    os.remove(self.legacy_saved_articles_file)
+                else:
+                    self._cache['saved_articles'] = []
+                self._index_saved()
+            return self._cache['saved_articles']
+    
+    def _index_saved(self):
+        """Rebuild the set of saved URLs used for O(1) duplicate checks"""
+        self._saved_urls = {article.get('url', '') for article in self._cache['saved_articles']}
+    
+    def _append_saved(self, record: Dict, stale_lines: int = 0):
+        """Append one record to the saved-articles log, compacting once it is mostly stale"""
+        with open(self.saved_articles_file, 'ab', buffering=FILE_BUFFER_SIZE) as f:
+            f.write(orjson.dumps(record) + b'\n')
+        self._stale_lines += stale_lines
+        if self._stale_lines > len(self._cache['saved_articles']):
+            self._compact_saved()
+    
+    def _compact_saved(self):
+        """Rewrite the saved-articles log with only the live articles"""
+        self._atomic_write(
+            self.saved_articles_file,
+            b''.join(orjson.dumps(article) + b'\n' for article in self._cache['saved_articles'])
+        )
+        self._stale_lines = 0
+    
+    @staticmethod
+    def _atomic_write(path: str, data: bytes):
+        """Write to a temporary file beside path and swap it in, so a crash never leaves a partial file"""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb', buffering=FILE_BUFFER_SIZE) as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    
+    def snapshot(self) -> Dict:
+        """Return the live cached contents of every data file; not copies, so read them under the lock and never mutate"""
+        with self._lock:
+            return {
+                'preferences': self._load('preferences', dict(DEFAULT_PREFERENCES)),
+                'saved_articles': self._load_saved(),
+                'ratings': self._load('ratings', {}),
+                'analytics': self._load_analytics()
+            }
+    
+    def flush(self):
+        """Write every dirty data file to disk"""
+        with self._lock:
+            for name in list(self._dirty):
+                # Compact output; only exports are pretty-printed
+                self._atomic_write(self._paths[name], orjson.dumps(self._cache[name], default=list))
+                self._dirty.discard(name)
+        
     def ensure_data_directory(self):
         """Ensure the data directory exists"""
         if not os.path.exists(self.data_dir):
@@ -27,8 +199,8 @@ class DataManager:
         try:
             preferences['last_updated'] = datetime.now().isoformat()
             
-            with open(self.preferences_file, 'w') as f:
-                json.dump(preferences, f, indent=2)
+            with self:
+                self._store('preferences', dict(preferences))
             return True
         except Exception as e:
             print(f"Error saving preferences: {str(e)}")
@@ -36,40 +208,28 @@ class DataManager:
     
     def load_user_preferences(self) -> Dict:
         """Load user preferences from file"""
-        default_preferences = {
-            'interests': [],
-            'frequency': 'daily',
-            'notifications': True,
-            'theme': 'light',
-            'last_updated': None
-        }
-        
         try:
-            if os.path.exists(self.preferences_file):
-                with open(self.preferences_file, 'r') as f:
-                    preferences = json.load(f)
-                return preferences
-            else:
-                return default_preferences
+            # Hand out copies so callers can't mutate the cache in place
+            return dict(self._load('preferences', dict(DEFAULT_PREFERENCES)))
         except Exception as e:
             print(f"Error loading preferences: {str(e)}")
-            return default_preferences
+            return dict(DEFAULT_PREFERENCES)
     
     def save_article(self, article: Dict) -> bool:
         """Save an article to the user's saved list"""
         try:
-            saved_articles = self.load_saved_articles()
-            
-            # Check if article already exists
-            article_id = article.get('url', '')
-            if not any(a.get('url') == article_id for a in saved_articles):
-                article['saved_at'] = datetime.now().isoformat()
-                saved_articles.append(article)
+            with self:
+                saved_articles = self._load_saved()
                 
-                with open(self.saved_articles_file, 'w') as f:
-                    json.dump(saved_articles, f, indent=2)
-                return True
-            return False
+                # Check if article already exists
+                article_id = article.get('url', '')
+                if article_id not in self._saved_urls:
+                    article['saved_at'] = datetime.now().isoformat()
+                    saved_articles.append(article)
+                    self._saved_urls.add(article_id)
+                    self._append_saved(article)
+                    return True
+                return False
         except Exception as e:
             print(f"Error saving article: {str(e)}")
             return False
@@ -77,10 +237,7 @@ class DataManager:
     def load_saved_articles(self) -> List[Dict]:
         """Load saved articles from file"""
         try:
-            if os.path.exists(self.saved_articles_file):
-                with open(self.saved_articles_file, 'r') as f:
-                    return json.load(f)
-            return []
+            return list(self._load_saved())
         except Exception as e:
             print(f"Error loading saved articles: {str(e)}")
             return []
@@ -88,11 +245,13 @@ class DataManager:
     def remove_saved_article(self, article_url: str) -> bool:
         """Remove an article from saved list"""
         try:
-            saved_articles = self.load_saved_articles()
-            saved_articles = [a for a in saved_articles if a.get('url') != article_url]
-            
-            with open(self.saved_articles_file, 'w') as f:
-                json.dump(saved_articles, f, indent=2)
+            with self:
+                saved_articles = self._load_saved()
+                if article_url in self._saved_urls:
+                    self._cache['saved_articles'] = [a for a in saved_articles if a.get('url', '') != article_url]
+                    self._saved_urls.discard(article_url)
+                    # The tombstone and the line it cancels are both stale
+                    self._append_saved({'_deleted': article_url}, stale_lines=2)
             return True
         except Exception as e:
             print(f"Error removing article: {str(e)}")
@@ -101,19 +260,18 @@ class DataManager:
     def update_saved_article(self, updated_article: dict) -> bool:
         """Update a saved article with new data (like AI summary)"""
         try:
-            saved_articles = self.load_saved_articles()
-            url = updated_article.get('url')
-            
-            # Find and update the article
-            for i, article in enumerate(saved_articles):
-                if article.get('url') == url:
-                    saved_articles[i] = updated_article
-                    
-                    with open(self.saved_articles_file, 'w') as f:
-                        json.dump(saved_articles, f, indent=2)
-                    return True
-            
-            return False  # Article not found
+            with self:
+                saved_articles = self._load_saved()
+                url = updated_article.get('url')
+                
+                # Find and update the article; the appended version supersedes the old line
+                for i, article in enumerate(saved_articles):
+                    if article.get('url') == url:
+                        saved_articles[i] = updated_article
+                        self._append_saved(updated_article, stale_lines=1)
+                        return True
+                
+                return False  # Article not found
         except Exception as e:
             print(f"Error updating saved article: {str(e)}")
             return False
@@ -121,16 +279,16 @@ class DataManager:
     def save_rating(self, article_url: str, rating: int, user_comment: str = "") -> bool:
         """Save a user rating for an article"""
         try:
-            ratings = self.load_ratings()
-            
-            ratings[article_url] = {
-                'rating': rating,
-                'comment': user_comment,
-                'rated_at': datetime.now().isoformat()
-            }
-            
-            with open(self.ratings_file, 'w') as f:
-                json.dump(ratings, f, indent=2)
+            with self:
+                ratings = self.load_ratings()
+                
+                ratings[article_url] = {
+                    'rating': rating,
+                    'comment': user_comment,
+                    'rated_at': datetime.now().isoformat()
+                }
+                
+                self._store('ratings', ratings)
             return True
         except Exception as e:
             print(f"Error saving rating: {str(e)}")
@@ -139,34 +297,29 @@ class DataManager:
     def load_ratings(self) -> Dict:
         """Load user ratings from file"""
         try:
-            if os.path.exists(self.ratings_file):
-                with open(self.ratings_file, 'r') as f:
-                    return json.load(f)
-            return {}
+            return dict(self._load('ratings', {}))
         except Exception as e:
             print(f"Error loading ratings: {str(e)}")
             return {}
     
     def get_article_rating(self, article_url: str) -> Optional[Dict]:
         """Get rating for a specific article"""
-        ratings = self.load_ratings()
-        return ratings.get(article_url)
+        try:
+            return self._load('ratings', {}).get(article_url)
+        except Exception as e:
+            print(f"Error loading ratings: {str(e)}")
+            return None
     
     def save_analytics(self, analytics_data: Dict) -> bool:
         """Save analytics data"""
         try:
             analytics_data['timestamp'] = datetime.now().isoformat()
             
-            # Load existing analytics
-            existing_analytics = self.load_analytics()
-            existing_analytics.append(analytics_data)
-            
-            # Keep only last 100 entries
-            if len(existing_analytics) > 100:
-                existing_analytics = existing_analytics[-100:]
-            
-            with open(self.analytics_file, 'w') as f:
-                json.dump(existing_analytics, f, indent=2)
+            with self:
+                # The deque drops the oldest entry once ANALYTICS_LIMIT is reached
+                analytics = self._load_analytics()
+                analytics.append(analytics_data)
+                self._store('analytics', analytics)
             return True
         except Exception as e:
             print(f"Error saving analytics: {str(e)}")
@@ -175,10 +328,7 @@ class DataManager:
     def load_analytics(self) -> List[Dict]:
         """Load analytics data"""
         try:
-            if os.path.exists(self.analytics_file):
-                with open(self.analytics_file, 'r') as f:
-                    return json.load(f)
-            return []
+            return list(self._load_analytics())
         except Exception as e:
             print(f"Error loading analytics: {str(e)}")
             return []
@@ -186,27 +336,24 @@ class DataManager:
     def get_user_stats(self) -> Dict:
         """Get user statistics"""
         try:
-            saved_articles = self.load_saved_articles()
-            ratings = self.load_ratings()
-            preferences = self.load_user_preferences()
-            
-            # Calculate average rating
-            avg_rating = 0
-            if ratings:
-                total_rating = sum(r['rating'] for r in ratings.values())
-                avg_rating = total_rating / len(ratings)
-            
-            # Get category preferences
-            category_counts = {}
-            for article in saved_articles:
-                category = article.get('category', 'Unknown')
-                category_counts[category] = category_counts.get(category, 0) + 1
+            # Aggregate over the live cache under the lock instead of copying each file
+            with self._lock:
+                data = self.snapshot()
+                saved_articles = data['saved_articles']
+                ratings = data['ratings']
+                preferences = data['preferences']
+                
+                # Calculate average rating
+                avg_rating = fmean(r['rating'] for r in ratings.values()) if ratings else 0
+                
+                # Get category preferences
+                category_counts = Counter(article.get('category', 'Unknown') for article in saved_articles)
             
             return {
                 'total_saved_articles': len(saved_articles),
                 'total_ratings': len(ratings),
                 'average_rating': round(avg_rating, 1),
-                'favorite_category': max(category_counts.items(), key=lambda x: x[1])[0] if category_counts else 'None',
+                'favorite_category': category_counts.most_common(1)[0][0] if category_counts else 'None',
                 'interests': preferences.get('interests', []),
                 'frequency': preferences.get('frequency', 'daily'),
                 'last_activity': preferences.get('last_updated')
@@ -218,16 +365,12 @@ class DataManager:
     def export_data(self, export_path: str) -> bool:
         """Export all user data to a JSON file"""
         try:
-            export_data = {
-                'preferences': self.load_user_preferences(),
-                'saved_articles': self.load_saved_articles(),
-                'ratings': self.load_ratings(),
-                'analytics': self.load_analytics(),
-                'exported_at': datetime.now().isoformat()
-            }
+            # Serialize straight from the live cache; the lock keeps it stable meanwhile
+            with self._lock:
+                export_data = {**self.snapshot(), 'exported_at': datetime.now().isoformat()}
+                payload = orjson.dumps(export_data, default=list, option=orjson.OPT_INDENT_2)
             
-            with open(export_path, 'w') as f:
-                json.dump(export_data, f, indent=2)
+            self._atomic_write(export_path, payload)
             return True
         except Exception as e:
             print(f"Error exporting data: {str(e)}")
@@ -236,8 +379,8 @@ class DataManager:
     def import_data(self, import_path: str) -> bool:
         """Import user data from a JSON file"""
         try:
-            with open(import_path, 'r') as f:
-                import_data = json.load(f)
+            with open(import_path, 'rb', buffering=FILE_BUFFER_SIZE) as f:
+                import_data = orjson.loads(f.read())
             
             # Validate import data
             required_keys = ['preferences', 'saved_articles', 'ratings']
@@ -245,13 +388,12 @@ class DataManager:
                 raise ValueError("Invalid import file format")
             
             # Save imported data
-            self.save_user_preferences(import_data['preferences'])
-            
-            with open(self.saved_articles_file, 'w') as f:
-                json.dump(import_data['saved_articles'], f, indent=2)
-            
-            with open(self.ratings_file, 'w') as f:
-                json.dump(import_data['ratings'], f, indent=2)
+            with self:
+                self.save_user_preferences(import_data['preferences'])
+                self._cache['saved_articles'] = list(import_data['saved_articles'])
+                self._index_saved()
+                self._compact_saved()
+                self._store('ratings', import_data['ratings'])
             
             return True
         except Exception as e:
@@ -264,13 +406,19 @@ class DataManager:
             files_to_remove = [
                 self.preferences_file,
                 self.saved_articles_file,
+                self.legacy_saved_articles_file,
                 self.ratings_file,
                 self.analytics_file
             ]
             
-            for file_path in files_to_remove:
-                if os.path.exists(file_path):
-                    os.remove(file_path)
+            with self._lock:
+                for file_path in files_to_remove:
+                    if os.path.exists(file_path):
+                        os.remove(file_path)
+                
+                self._cache.clear()
+                self._dirty.clear()
+                self._stale_lines = 0
             
             return True
         except Exception as e:
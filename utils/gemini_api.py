@@ -1,8 +1,22 @@
 import google.generativeai as genai
+import asyncio
+import hashlib
+import html
+import json
 import os
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
 import time
 
+# Number of model responses kept in memory, least recently used evicted first
+RESPONSE_CACHE_SIZE = 1024
+
+# One "- point" or "• point" bullet per line, captured without its marker
+_BULLET_RE = re.compile(r'^[ \t]*[-•][ \t]*(.+?)[ \t\r]*$', re.M)
+
 class GeminiAPIClient:
     """Client for interacting with Gemini API for text summarization and analysis"""
     
@@ -14,6 +28,33 @@ class GeminiAPIClient:
         genai.configure(api_key=self.api_key)
         self.model = genai.GenerativeModel('gemini-pro')
         
+        # Model responses keyed by a digest of the prompt
+        self._responses = OrderedDict()
+        self._responses_lock = threading.Lock()
+    
+    def _generate(self, prompt: str, parse=None):
+        """Return the model's text for a prompt (or parse(text)), reusing earlier answers to the same prompt"""
+        key = hashlib.blake2b(prompt.encode(), digest_size=16).digest()
+        with self._responses_lock:
+            if key in self._responses:
+                self._responses.move_to_end(key)
+                text = self._responses[key]
+                return parse(text) if parse else text
+        
+        # Failures raise here, so only successful, parseable responses are remembered
+        text = self.model.generate_content(prompt).text
+        result = parse(text) if parse else text
+        with self._responses_lock:
+            self._responses[key] = text
+            if len(self._responses) > RESPONSE_CACHE_SIZE:
+                self._responses.popitem(last=False)
+        return result
+    
+    @staticmethod
+    def _parse_json(text: str):
+        """Parse a JSON reply, tolerating the markdown code fence the model sometimes adds"""
+        return json.loads(text.strip().removeprefix('```json').removeprefix('```').removesuffix('```'))
+        
     def summarize_article(self, title: str, content: str, max_length: int = 200) -> str:
         """Summarize an article with enhanced context"""
         try:
@@ -34,8 +75,8 @@ class GeminiAPIClient:
             - Maintain journalistic tone
             """
             
-            response = self.model.generate_content(prompt)
-            return response.text.strip()
+            response_text = self._generate(prompt)
+            return response_text.strip()
             
         except Exception as e:
             return f"Summary unavailable: {str(e)}"
@@ -49,6 +90,93 @@ class GeminiAPIClient:
         except Exception as e:
             return f"Summary unavailable: {str(e)}"
     
+    def summarize_batch(self, articles: List[Dict], max_length: int = 60) -> List[Dict]:
+        """Summarize several articles with a single request, returning [{'id', 'summary'}, ...]"""
+        try:
+            if not articles:
+                return []
+            
+            entries = []
+            for i, article in enumerate(articles):
+                content = self._clean_content(article.get('description', '') or article.get('content', ''))
+                entries.append({'id': i, 'title': article.get('title', ''), 'content': content[:1000]})
+            
+            prompt = f"""
+            Summarize each of the following news articles in {max_length} words or less.
+            
+            Articles: {json.dumps(entries)}
+            
+            Respond with only a JSON array of objects like {{"id": <article id>, "summary": "<summary>"}}.
+            """
+            
+            results = self._generate(prompt, parse=self._parse_json)
+            
+            return [
+                result for result in results
+                if isinstance(result, dict) and isinstance(result.get('id'), int)
+                and 0 <= result['id'] < len(articles) and result.get('summary')
+            ]
+            
+        except Exception as e:
+            print(f"Error batch summarizing articles: {str(e)}")
+            return []
+    
+    def analyze_article(self, title: str, content: str, max_length: int = 200) -> Dict:
+        """Summarize, categorize, extract key points and gauge sentiment with a single request"""
+        try:
+            clean_content = self._clean_content(content)
+            
+            prompt = f"""
+            Analyze this news article:
+            
+            Title: {title}
+            Content: {clean_content[:1500]}...
+            
+            Respond with only a JSON object with these fields:
+            - "summary": a concise, engaging summary of the key facts in {max_length} words or less, in a journalistic tone
+            - "category": one of Technology, Business, Science, Politics, Sports, Entertainment
+            - "key_points": a list of 3-5 concise key points
+            - "sentiment": {{"Sentiment": "Positive, Negative or Neutral", "Confidence": "High, Medium or Low", "Explanation": "brief explanation"}}
+            """
+            
+            def parse_analysis(text):
+                analysis = self._parse_json(text)
+                if not isinstance(analysis, dict) or not analysis.get('summary'):
+                    raise ValueError("Incomplete analysis in model response")
+                return analysis
+            
+            analysis = self._generate(prompt, parse=parse_analysis)
+            return {
+                'summary': str(analysis['summary']).strip(),
+                'category': analysis.get('category') or 'General',
+                'key_points': [str(point) for point in analysis.get('key_points') or []][:5],
+                'sentiment': analysis.get('sentiment') or {}
+            }
+            
+        except ValueError:
+            # The model ignored the JSON format; fall back to the per-field prompts
+            return {
+                'summary': self.summarize_article(title, content, max_length),
+                'category': 'General',
+                'key_points': self.extract_key_points(title, content),
+                'sentiment': {
+                    'Sentiment': 'Unknown',
+                    'Confidence': 'Low',
+                    'Explanation': 'Sentiment not analyzed'
+                }
+            }
+        except Exception as e:
+            return {
+                'summary': f"Summary unavailable: {str(e)}",
+                'category': 'General',
+                'key_points': ["Key points unavailable"],
+                'sentiment': {
+                    'Sentiment': 'Unknown',
+                    'Confidence': 'Low',
+                    'Explanation': f'Analysis failed: {str(e)}'
+                }
+            }
+    
     def categorize_article(self, title: str, content: str) -> str:
         """Categorize an article based on its content"""
         try:
@@ -69,8 +197,8 @@ class GeminiAPIClient:
             Respond with only the category name.
             """
             
-            response = self.model.generate_content(prompt)
-            return response.text.strip()
+            response_text = self._generate(prompt)
+            return response_text.strip()
             
         except Exception as e:
             return "General"
@@ -89,12 +217,10 @@ class GeminiAPIClient:
             Format as a bulleted list with concise points.
             """
             
-            response = self.model.generate_content(prompt)
-            # Parse bullet points
-            points = [point.strip().lstrip('- ').lstrip('• ') 
-                     for point in response.text.split('\n') 
-                     if point.strip().startswith(('-', '•'))]
-            return points[:5]  # Limit to 5 points
+            response_text = self._generate(prompt)
+            # Parse bullet points, limited to 5
+            points = _BULLET_RE.findall(response_text)[:5]
+            return points or ["Key points unavailable"]
             
         except Exception as e:
             return ["Key points unavailable"]
@@ -120,8 +246,8 @@ class GeminiAPIClient:
             Provide a 2-3 sentence overview highlighting the main themes and most important stories.
             """
             
-            response = self.model.generate_content(prompt)
-            return response.text.strip()
+            response_text = self._generate(prompt)
+            return response_text.strip()
             
         except Exception as e:
             return f"Digest summary unavailable: {str(e)}"
@@ -146,10 +272,10 @@ class GeminiAPIClient:
             Explanation: [brief explanation]
             """
             
-            response = self.model.generate_content(prompt)
+            response_text = self._generate(prompt)
             
             # Parse the response
-            lines = response.text.strip().split('\n')
+            lines = response_text.strip().split('\n')
             sentiment_data = {}
             
             for line in lines:
@@ -170,7 +296,8 @@ class GeminiAPIClient:
         """Estimate reading time in minutes"""
         try:
             # Average reading speed: 200-250 words per minute
-            word_count = len(content.split())
+            # Counting spaces approximates the word count without building a list of words
+            word_count = content.count(' ') + 1 if content else 0
             reading_time = max(1, word_count // 225)  # Conservative estimate
             return reading_time
         except:
@@ -181,51 +308,86 @@ class GeminiAPIClient:
         if not content:
             return ""
         
-        # Remove extra whitespace and normalize
-        cleaned = ' '.join(content.split())
+        # Decode HTML entities, then collapse whitespace (including the decoded &nbsp;)
+        return ' '.join(html.unescape(content).split())
+    
+    def enrich_article(self, article: Dict) -> Dict:
+        """Add summary, key points and reading time to a single article"""
+        try:
+            title = article.get('title', '')
+            content = article.get('content', '')
+            
+            # Summary and key points come from one fused request
+            analysis = self.analyze_article(title, content)
+            article['ai_summary'] = analysis['summary']
+            article['key_points'] = analysis['key_points']
+            
+            # Estimate reading time
+            reading_time = self.generate_reading_time(content)
+            article['reading_time'] = reading_time
+            
+        except Exception as e:
+            print(f"Error summarizing article '{article.get('title', 'Unknown')}': {str(e)}")
+            article['ai_summary'] = "Summary unavailable"
+            article['key_points'] = ["Key points unavailable"]
+            article['reading_time'] = 2
+        
+        return article
+    
+    def batch_summarize(self, articles: List[Dict], delay: float = 1.0,
+                        max_workers: int = 4) -> List[Dict]:
+        """Summarize multiple articles in parallel, starting at most one every `delay` seconds"""
+        pacing_lock = threading.Lock()
+        next_start = time.monotonic()
         
-        # Remove common HTML artifacts
-        cleaned = cleaned.replace('&nbsp;', ' ')
-        cleaned = cleaned.replace('&amp;', '&')
-        cleaned = cleaned.replace('&lt;', '<')
-        cleaned = cleaned.replace('&gt;', '>')
+        def enrich_paced(article):
+            nonlocal next_start
+            # Rate limiting: reserve the next start slot, then wait for it outside the lock
+            with pacing_lock:
+                now = time.monotonic()
+                start = max(next_start, now)
+                next_start = start + delay
+            time.sleep(start - now)
+            return self.enrich_article(article)
         
-        return cleaned
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(enrich_paced, articles))
     
-    def batch_summarize(self, articles: List[Dict], delay: float = 1.0) -> List[Dict]:
-        """Summarize multiple articles with rate limiting"""
-        summarized_articles = []
+    async def async_batch_summarize(self, articles: List[Dict], concurrency: int = 8,
+                                    max_retries: int = 3, enrich=None,
+                                    on_complete=None) -> List[Dict]:
+        """Summarize multiple articles concurrently, at most `concurrency` at a time"""
+        # Callers may substitute a caching wrapper around enrich_article
+        enrich_one = enrich or self.enrich_article
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def enrich_with_retry(article):
+            async with semaphore:
+                for attempt in range(max_retries):
+                    # The SDK is synchronous, so each call runs on the default executor
+                    await loop.run_in_executor(None, enrich_one, article)
+                    summary = article.get('ai_summary', '')
+                    
+                    # Back off exponentially only when the call failed on an exhausted quota,
+                    # not when a real summary happens to mention one
+                    failed = summary.startswith("Summary unavailable")
+                    if not (failed and ('429' in summary or 'quota' in summary.lower())):
+                        break
+                    if attempt < max_retries - 1:
+                        await asyncio.sleep(2 ** attempt)
+                return article
+        
+        tasks = [asyncio.ensure_future(enrich_with_retry(article)) for article in articles]
         
-        for article in articles:
-            try:
-                title = article.get('title', '')
-                content = article.get('content', '')
-                
-                # Generate summary
-                summary = self.summarize_article(title, content)
-                article['ai_summary'] = summary
-                
-                # Extract key points
-                key_points = self.extract_key_points(title, content)
-                article['key_points'] = key_points
-                
-                # Estimate reading time
-                reading_time = self.generate_reading_time(content)
-                article['reading_time'] = reading_time
-                
-                summarized_articles.append(article)
-                
-                # Rate limiting
-                time.sleep(delay)
-                
-            except Exception as e:
-                print(f"Error summarizing article '{article.get('title', 'Unknown')}': {str(e)}")
-                article['ai_summary'] = "Summary unavailable"
-                article['key_points'] = ["Key points unavailable"]
-                article['reading_time'] = 2
-                summarized_articles.append(article)
+        # Report each article as it lands rather than after the slowest call;
+        # on_complete(article, done, total) runs on the event loop's thread
+        for done, task in enumerate(asyncio.as_completed(tasks), 1):
+            article = await task
+            if on_complete:
+                on_complete(article, done, len(tasks))
         
-        return summarized_articles
+        return [task.result() for task in tasks]
     
     def get_model_info(self) -> Dict:
         """Get information about the current model"""
@@ -1,18 +1,66 @@
 import requests
+from requests.adapters import HTTPAdapter
+from requests_cache import CachedSession
 import os
-import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
-import json
+from types import MappingProxyType
+from typing import List, Dict, Mapping, Optional, Tuple
+import orjson
+
+# Upper bound on concurrent interest searches, also used as the connection pool size
+MAX_CONCURRENT_REQUESTS = 8
+
+# Keywords for each interest
+_INTEREST_KEYWORDS: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    'Technology': ('artificial intelligence', 'cybersecurity', 'software', 'hardware', 'startups'),
+    'Business': ('finance', 'economy', 'markets', 'entrepreneurship', 'corporate'),
+    'Science': ('research', 'discoveries', 'health', 'environment', 'space'),
+    'Politics': ('government', 'policy', 'elections', 'international relations'),
+    'Sports': ('football', 'basketball', 'tennis', 'olympics', 'soccer'),
+    'Entertainment': ('movies', 'music', 'celebrity', 'gaming', 'streaming')
+})
+
+# Each interest is searched with one OR query over its first two keywords, built once at import
+_INTEREST_SEARCH_KEYWORDS: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    interest: keywords[:2] for interest, keywords in _INTEREST_KEYWORDS.items()
+})
+_INTEREST_QUERY: Mapping[str, str] = MappingProxyType({
+    interest: ' OR '.join(f'"{keyword}"' for keyword in keywords)
+    for interest, keywords in _INTEREST_SEARCH_KEYWORDS.items()
+})
+
+# SQLite file for the HTTP cache, so responses survive restarts
+HTTP_CACHE_PATH = os.path.join('data', 'newsapi_http_cache')
+
+# Seconds a cached response is served before NewsAPI is asked again
+HTTP_CACHE_EXPIRY = 300
+
+def create_http_session(max_retries=0, pool_maxsize: int = MAX_CONCURRENT_REQUESTS) -> requests.Session:
+    """Build a pooled session that caches NewsAPI responses on disk and honours Cache-Control"""
+    session = CachedSession(
+        HTTP_CACHE_PATH,
+        backend='sqlite',
+        expire_after=HTTP_CACHE_EXPIRY,
+        cache_control=True,
+        allowable_codes=(200,),
+        # Keep the API key out of cache keys and stored request URLs
+        ignored_parameters=['apiKey']
+    )
+    session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize, max_retries=max_retries))
+    return session
 
 class NewsAPIClient:
     """Client for interacting with NewsAPI"""
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, session: Optional[requests.Session] = None):
         self.api_key = api_key or os.getenv('NEWS_API_KEY')
         self.base_url = "https://newsapi.org/v2"
-        self.cache = {}
-        self.cache_duration = 300  # 5 minutes
+        self.cache_duration = HTTP_CACHE_EXPIRY
+        
+        # One pooled, disk-cached session so concurrent searches reuse TLS connections; callers may share theirs.
+        # Responses are cached by the session alone, so Cache-Control revalidation applies to every hit
+        self.session = session or create_http_session()
         
     def _make_request(self, endpoint: str, params: Dict) -> Dict:
         """Make a request to NewsAPI with error handling"""
@@ -20,10 +68,11 @@ class NewsAPIClient:
             url = f"{self.base_url}/{endpoint}"
             params['apiKey'] = self.api_key
             
-            response = requests.get(url, params=params, timeout=10)
+            response = self.session.get(url, params=params, timeout=10)
             
             if response.status_code == 200:
-                return response.json()
+                # Decode the UTF-8 body directly rather than via response.text and the stdlib json
+                return orjson.loads(response.content)
             elif response.status_code == 401:
                 raise Exception("Invalid API key. Please check your NewsAPI key.")
             elif response.status_code == 429:
@@ -43,13 +92,6 @@ class NewsAPIClient:
                        page_size: int = 20) -> List[Dict]:
         """Search for articles based on query"""
         
-        # Check cache first
-        cache_key = f"search_{query}_{from_date}_{sort_by}_{language}_{page_size}"
-        if cache_key in self.cache:
-            cached_data, timestamp = self.cache[cache_key]
-            if time.time() - timestamp < self.cache_duration:
-                return cached_data
-        
         params = {
             'q': query,
             'sortBy': sort_by,
@@ -62,12 +104,7 @@ class NewsAPIClient:
         
         try:
             result = self._make_request('everything', params)
-            articles = result.get('articles', [])
-            
-            # Cache the result
-            self.cache[cache_key] = (articles, time.time())
-            
-            return articles
+            return result.get('articles', [])
             
         except Exception as e:
             print(f"Error searching articles for '{query}': {str(e)}")
@@ -77,12 +114,6 @@ class NewsAPIClient:
                          page_size: int = 20) -> List[Dict]:
         """Get top headlines for a country/category"""
         
-        cache_key = f"headlines_{country}_{category}_{page_size}"
-        if cache_key in self.cache:
-            cached_data, timestamp = self.cache[cache_key]
-            if time.time() - timestamp < self.cache_duration:
-                return cached_data
-        
         params = {
             'country': country,
             'pageSize': page_size
@@ -93,12 +124,7 @@ class NewsAPIClient:
         
         try:
             result = self._make_request('top-headlines', params)
-            articles = result.get('articles', [])
-            
-            # Cache the result
-            self.cache[cache_key] = (articles, time.time())
-            
-            return articles
+            return result.get('articles', [])
             
         except Exception as e:
             print(f"Error getting top headlines: {str(e)}")
@@ -108,12 +134,6 @@ class NewsAPIClient:
                    country: str = 'us') -> List[Dict]:
         """Get available news sources"""
         
-        cache_key = f"sources_{category}_{language}_{country}"
-        if cache_key in self.cache:
-            cached_data, timestamp = self.cache[cache_key]
-            if time.time() - timestamp < self.cache_duration:
-                return cached_data
-        
         params = {
             'language': language,
             'country': country
@@ -124,12 +144,7 @@ class NewsAPIClient:
         
         try:
             result = self._make_request('sources', params)
-            sources = result.get('sources', [])
-            
-            # Cache the result
-            self.cache[cache_key] = (sources, time.time())
-            
-            return sources
+            return result.get('sources', [])
             
         except Exception as e:
             print(f"Error getting sources: {str(e)}")
@@ -141,50 +156,48 @@ class NewsAPIClient:
         
         all_articles = []
         
-        # Define keywords for each interest
-        interest_keywords = {
-            'Technology': ['artificial intelligence', 'cybersecurity', 'software', 'hardware', 'startups'],
-            'Business': ['finance', 'economy', 'markets', 'entrepreneurship', 'corporate'],
-            'Science': ['research', 'discoveries', 'health', 'environment', 'space'],
-            'Politics': ['government', 'policy', 'elections', 'international relations'],
-            'Sports': ['football', 'basketball', 'tennis', 'olympics', 'soccer'],
-            'Entertainment': ['movies', 'music', 'celebrity', 'gaming', 'streaming']
-        }
-        
         # Calculate date range
         if frequency == 'daily':
             from_date = (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d')
         else:  # weekly
             from_date = (datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d')
         
-        for interest in interests:
-            if interest in interest_keywords:
-                for keyword in interest_keywords[interest][:2]:  # Limit keywords per interest
-                    articles = self.search_articles(
-                        query=keyword,
-                        from_date=from_date,
-                        page_size=5
-                    )
-                    
-                    # Add category and keyword metadata
-                    for article in articles:
-                        article['category'] = interest
-                        article['keyword'] = keyword
-                    
-                    all_articles.extend(articles)
-                    
-                    # Rate limiting
-                    time.sleep(0.1)
+        searches = [interest for interest in interests if interest in _INTEREST_QUERY]
+        
+        if not searches:
+            return all_articles
+        
+        def fetch_one(interest):
+            keywords = _INTEREST_SEARCH_KEYWORDS[interest]
+            articles = self.search_articles(
+                query=_INTEREST_QUERY[interest],
+                from_date=from_date,
+                page_size=5 * len(keywords)
+            )
+            
+            # Add category and keyword metadata; the keyword is the first one the article mentions
+            for article in articles:
+                text = f"{article.get('title') or ''} {article.get('description') or ''}".lower()
+                article['category'] = interest
+                article['keyword'] = next((keyword for keyword in keywords if keyword in text), keywords[0])
+            
+            return articles
+        
+        # Run the interest searches concurrently; the pool size caps the request rate
+        with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_REQUESTS, len(searches))) as executor:
+            for articles in executor.map(fetch_one, searches):
+                all_articles.extend(articles)
         
         return all_articles
     
     def clear_cache(self):
-        """Clear the cache"""
-        self.cache.clear()
+        """Clear the on-disk HTTP cache"""
+        if isinstance(self.session, CachedSession):
+            self.session.cache.clear()
     
     def get_cache_stats(self) -> Dict:
         """Get cache statistics"""
         return {
-            'cache_size': len(self.cache),
+            'cache_size': len(self.session.cache.responses) if isinstance(self.session, CachedSession) else 0,
             'cache_duration': self.cache_duration
         }